@@ -11,10 +11,11 @@ from bridge_psci.io.excel_io import create_excel_template
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--out", default="bridge_input_template_v3.xlsx", help="Output .xlsx path")
+    ap.add_argument("--fast", action="store_true", help="Stream the workbook in openpyxl write-only mode")
     args = ap.parse_args()
 
     out = Path(args.out)
-    create_excel_template(out)
+    create_excel_template(out, fast=args.fast)
     print("✅ Wrote template:", out.resolve())
 
 
@@ -2,35 +2,63 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import os
+import time
 from pathlib import Path
 
 from bridge_psci.io.excel_io import load_params_from_excel
-from bridge_psci.analysis.modal import run_modal
+from bridge_psci.analysis.modal import prepare_domain, run_modal
 from bridge_psci.analysis.moving_load import run_moving_load
 
 
+def _run_case(excel_path: Path, case: str, out_root: Path, skip_modal: bool, skip_moving: bool) -> float:
+    """Run one case end-to-end and return its wall time (s)."""
+    t0 = time.perf_counter()
+    out_dir = out_root / case
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    params = load_params_from_excel(excel_path, case=case)
+
+    # Build the model and solve the eigenproblem once; both analyses reuse the domain.
+    precomputed = prepare_domain(params) if not (skip_modal and skip_moving) else None
+
+    if not skip_modal:
+        run_modal(params=params, output_dir=out_dir, case_label=case, precomputed=precomputed)
+
+    if not skip_moving:
+        run_moving_load(params=params, output_dir=out_dir, case_label=case, precomputed=precomputed)
+
+    return time.perf_counter() - t0
+
+
 def main():
     ap = argparse.ArgumentParser(description="Run modal + moving-load analyses from an Excel workbook.")
     ap.add_argument("--excel", required=True, help="Path to v3 (multi-sheet) or v2 Excel template")
     ap.add_argument("--case", default="baseline", help="Case label (from Excel 'Cases' sheet). Default: baseline")
+    ap.add_argument("--cases", default=None, help="Comma-separated case labels, run in parallel worker processes")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes for --cases. Default: CPU count")
     ap.add_argument("--out", default="outputs", help="Output directory")
     ap.add_argument("--skip_modal", action="store_true", help="Skip modal analysis")
     ap.add_argument("--skip_moving", action="store_true", help="Skip moving-load analysis")
     args = ap.parse_args()
 
     excel_path = Path(args.excel)
-    out_dir = Path(args.out) / args.case
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    params = load_params_from_excel(excel_path, case=args.case)
-
-    if not args.skip_modal:
-        run_modal(params=params, output_dir=out_dir, case_label=args.case)
+    out_root = Path(args.out)
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()] if args.cases else [args.case]
+    jobs = [(excel_path, c, out_root, args.skip_modal, args.skip_moving) for c in cases]
 
-    if not args.skip_moving:
-        run_moving_load(params=params, output_dir=out_dir, case_label=args.case)
+    if len(jobs) == 1:
+        timings = [_run_case(*jobs[0])]
+    else:
+        # One OpenSees domain per process; 'spawn' gives each worker a clean interpreter.
+        n_workers = args.workers or min(len(jobs), os.cpu_count() or 1)
+        with multiprocessing.get_context("spawn").Pool(n_workers) as pool:
+            timings = pool.starmap(_run_case, jobs)
 
-    print(f"✅ Done. Results in: {out_dir.resolve()}")
+    for case, elapsed in zip(cases, timings):
+        print(f"  {case}: {elapsed:.1f} s")
+    print(f"✅ Done. Results in: {out_root.resolve()}")
 
 
 if __name__ == "__main__":
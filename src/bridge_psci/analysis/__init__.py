@@ -1,9 +1,17 @@
 """Bridge analysis module for modal and moving load analyses."""
 
-from .modal import run_modal
-from .moving_load import run_moving_load
-
 __all__ = [
     "run_modal",
     "run_moving_load",
 ]
+
+
+def __getattr__(name):
+    # Deferred (PEP 562) so importing one analysis does not pull in the other's dependencies.
+    if name == "run_modal":
+        from .modal import run_modal
+        return run_modal
+    if name == "run_moving_load":
+        from .moving_load import run_moving_load
+        return run_moving_load
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ This module is based on notebook cell 12, wrapped into a function.
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
+from typing import Any, Sequence, Tuple
 from pathlib import Path
 import json
 
@@ -17,10 +17,45 @@ except Exception as e:  # pragma: no cover
     ops = None  # type: ignore
     _OPENSEESPY_IMPORT_ERROR = e
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from ..model.builder import build_bridge_model
 
 
+def solve_eigen(num_eigen: int, solver: str | None = None):
+    """Run `ops.eigen` with an optional solver flag.
+
+    `solver` is passed straight to OpenSees (e.g. '-genBandArpack', the shift-and-invert
+    ARPACK default, or '-fullGenLapack' for small models); None keeps OpenSees' default.
+    """
+    if solver:
+        return ops.eigen(str(solver), int(num_eigen))
+    return ops.eigen(int(num_eigen))
+
+
+def prepare_domain(params: dict):
+    """Build the model and solve the eigenproblem once.
+
+    Returns `(bridge, eigen_values)`; pass it as `precomputed=` to `run_modal` and
+    `run_moving_load` so both analyses share the same OpenSees domain.
+
+    The result is only valid for the domain this call just built: nothing else may
+    rebuild or wipe the OpenSees model in between. The eigenvalues are solved on the
+    unloaded model, before `run_modal` applies its static patterns; the model is
+    linear elastic, so the frequencies match the notebook order (static load first,
+    eigen after).
+    """
+    if ops is None:  # pragma: no cover
+        raise ImportError('openseespy is required') from _OPENSEESPY_IMPORT_ERROR
+
+    bridge = build_bridge_model(params)
+    eigen_values = solve_eigen(int(params.get("numEigen", 3)), params.get("eigen_solver"))
+    return bridge, np.array(eigen_values, dtype=float)
+
+
 def run_modal(
     params: dict,
     check_nodes: Sequence[int] = (1075, 2075, 3075, 4075, 5075, 6075),
@@ -30,10 +65,8 @@ def run_modal(
     output_dir: str | Path | None = None,
     case_label: str = "baseline",
     save_json: bool = True,
+    precomputed: Tuple[Any, Sequence[float]] | None = None,
 ):
-    if ops is None:  # pragma: no cover
-        raise ImportError('openseespy is required') from _OPENSEESPY_IMPORT_ERROR
-
     """Build model, apply a simple static load, and extract eigen-frequencies.
 
     Parameters
@@ -48,12 +81,27 @@ def run_modal(
         Total point load (N). Default: -290 kN (from notebook).
     num_eigen:
         Number of eigenvalues to extract. Default: params['numEigen'] or 3.
+    precomputed:
+        `(bridge, eigen_values)` from `prepare_domain(params)` with the same `params`,
+        called on the current OpenSees domain (no rebuild or wipe in between). The model
+        is not rebuilt and the eigenvalues are reused. Side effect: after the static
+        check, load patterns 1-3 are removed and the domain is reset (`ops.reset()`,
+        `ops.wipeAnalysis()`) so it can be handed to `run_moving_load` unloaded.
 
     Returns
     -------
     natural_frequency_hz, eigen_values, deflections_mm
     """
-    bridge1 = build_bridge_model(params)
+    if ops is None:  # pragma: no cover
+        raise ImportError('openseespy is required') from _OPENSEESPY_IMPORT_ERROR
+
+    if precomputed is None:
+        bridge1 = build_bridge_model(params)
+    else:
+        bridge1 = precomputed[0]
+
+    check_nodes = [int(n) for n in check_nodes]
+    load_nodes = (int(load_nodes[0]), int(load_nodes[1]))
 
     if point_load_n is None:
         point_load_n = float(params.get("point_load_n", -290 * 1000))
@@ -61,17 +109,25 @@ def run_modal(
         num_eigen = int(params.get("numEigen", 3))
 
     # Baseline (no load)
-    bridge1.analysis.static_analysis_load(1, int(load_nodes[0]), 0.0, 0.0, 0.0, 0.0)
-    before = np.array([ops.nodeDisp(int(n), 3) for n in check_nodes], dtype=float)
+    bridge1.analysis.static_analysis_load(1, load_nodes[0], 0.0, 0.0, 0.0, 0.0)
+    before = np.array([ops.nodeDisp(n, 3) for n in check_nodes], dtype=float)
 
     # Apply load split over two nodes (same as notebook)
-    bridge1.analysis.static_analysis_load(2, int(load_nodes[0]), point_load_n / 2.0, 0.0, 0.0, 0.0)
-    bridge1.analysis.static_analysis_load(3, int(load_nodes[1]), point_load_n / 2.0, 0.0, 0.0, 0.0)
-    after = np.array([ops.nodeDisp(int(n), 3) for n in check_nodes], dtype=float)
+    bridge1.analysis.static_analysis_load(2, load_nodes[0], point_load_n / 2.0, 0.0, 0.0, 0.0)
+    bridge1.analysis.static_analysis_load(3, load_nodes[1], point_load_n / 2.0, 0.0, 0.0, 0.0)
+    after = np.array([ops.nodeDisp(n, 3) for n in check_nodes], dtype=float)
 
     deflections = after - before  # mm
 
-    eigen_values = ops.eigen(num_eigen)
+    if precomputed is None:
+        eigen_values = solve_eigen(num_eigen, params.get("eigen_solver"))
+    else:
+        eigen_values = precomputed[1]
+        # Hand the shared domain back unloaded and at its initial state.
+        for pattern_tag in (1, 2, 3):
+            ops.remove("loadPattern", pattern_tag)
+        ops.reset()
+        ops.wipeAnalysis()
     natural_frequency = np.sqrt(np.array(eigen_values, dtype=float)) / (2.0 * np.pi)
 
 
@@ -81,17 +137,24 @@ def run_modal(
         out_dir.mkdir(parents=True, exist_ok=True)
         payload = {
             "case_label": str(case_label),
-            "check_nodes": [int(x) for x in check_nodes],
-            "load_nodes": [int(x) for x in load_nodes],
+            "check_nodes": check_nodes,
+            "load_nodes": list(load_nodes),
             "point_load_n": float(point_load_n),
             "num_eigen": int(num_eigen),
-            "eigen_values": [float(x) for x in np.array(eigen_values, dtype=float).tolist()],
-            "natural_frequency_hz": [float(x) for x in natural_frequency.tolist()],
-            "static_deflections_mm": [float(x) for x in deflections.tolist()],
+            "eigen_values": np.asarray(eigen_values, dtype=float),
+            "natural_frequency_hz": np.asarray(natural_frequency, dtype=float),
+            "static_deflections_mm": np.asarray(deflections, dtype=float),
         }
-        (out_dir / f"({case_label})modal_results.json").write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        json_path = out_dir / f"({case_label})modal_results.json"
+        if orjson is not None:
+            json_path.write_bytes(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            payload = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in payload.items()}
+            json_path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
 
     return natural_frequency, np.array(eigen_values, dtype=float), deflections
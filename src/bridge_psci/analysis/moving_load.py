@@ -6,11 +6,12 @@ behavior very close to the notebook, but expose it as a reusable function.
 
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Sequence, Tuple
 
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
 try:
     import openseespy.opensees as ops  # type: ignore
     _OPENSEESPY_IMPORT_ERROR = None
@@ -18,13 +19,18 @@ except Exception as e:  # pragma: no cover
     ops = None  # type: ignore
     _OPENSEESPY_IMPORT_ERROR = e
 
+try:  # optional
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None
+
 
 from ..config import ensure_dir
 from ..model.builder import build_bridge_model
+from .modal import solve_eigen
 
 
-def _get_girder_tags(start_tag: int, n_nodes: int) -> np.ndarray:
-    tags = np.array(ops.getNodeTags(), dtype=int)
+def _get_girder_tags(tags: np.ndarray, start_tag: int, n_nodes: int) -> np.ndarray:
     idx0 = np.where(tags == int(start_tag))[0]
     if idx0.size == 0:
         raise RuntimeError(f"Start tag {start_tag} not found in current OpenSees domain.")
@@ -32,6 +38,137 @@ def _get_girder_tags(start_tag: int, n_nodes: int) -> np.ndarray:
     return tags[i0 : i0 + int(n_nodes)]
 
 
+def _read_recorder(path: str | Path) -> np.ndarray:
+    """Load a whitespace-delimited OpenSees recorder file with pandas' C parser."""
+    return pd.read_csv(path, sep=r"\s+", header=None, engine="c").to_numpy(dtype=float)
+
+
+def _node_coords(tags: np.ndarray) -> np.ndarray:
+    """Return an (N, 3) coordinate table for `tags`, filled in a single pass."""
+    return np.fromiter(
+        (c for nd in tags for c in ops.nodeCoord(int(nd))), dtype=float, count=3 * len(tags)
+    ).reshape(-1, 3)
+
+
+def _uniform_inv_spacing(x_g: np.ndarray) -> float:
+    """Return 1/dx if the girder nodes are equally spaced, else 0.0 (use a search)."""
+    dx = np.diff(x_g)
+    if np.allclose(dx, dx[0], rtol=1e-9, atol=0.0):
+        return float(1.0 / dx[0])
+    return 0.0
+
+
+def _accumulate_axle_loads_numpy(
+    hist: np.ndarray,
+    x_g: np.ndarray,
+    x_front: np.ndarray,
+    dists: np.ndarray,
+    loads: np.ndarray,
+    inv_dx: float = 0.0,
+) -> None:
+    """Scatter axle loads onto the girder nodes bracketing each axle (in place).
+
+    `hist` is a dense `(n_nodes, T)` array, `x_front` the front-axle x-position per
+    time step. Each axle load is split linearly between the two neighbouring nodes,
+    exactly as in the notebook's per-timestep loop. With `inv_dx > 0` (uniform mesh)
+    the segment index is computed directly instead of searched.
+    """
+    x_axle = x_front[:, None] + dists[None, :]  # (T, n_axles)
+    valid = (x_axle >= x_g[0]) & (x_axle <= x_g[-1])
+
+    if inv_dx > 0.0:
+        idx = np.floor((x_axle - x_g[0]) * inv_dx).astype(np.intp)
+    else:
+        idx = np.searchsorted(x_g, x_axle) - 1
+    idx = np.clip(idx, 0, len(x_g) - 2)
+    r = (x_axle - x_g[idx]) / np.diff(x_g)[idx]
+
+    t_idx = np.broadcast_to(np.arange(x_axle.shape[0])[:, None], x_axle.shape)
+    load = np.broadcast_to(loads[None, :], x_axle.shape)
+
+    idx, t_idx, r, load = idx[valid], t_idx[valid], r[valid], load[valid]
+    np.add.at(hist, (idx, t_idx), load * (1 - r))
+    np.add.at(hist, (idx + 1, t_idx), load * r)
+
+
+def _active_window(values: np.ndarray) -> tuple[int, int]:
+    """Return `(i0, i1)` spanning the non-zero samples plus one zero sample on each side.
+
+    Keeping the bracketing zeros preserves the linear ramp in/out of the Path series.
+    """
+    nz = np.flatnonzero(values)
+    return max(int(nz[0]) - 1, 0), min(int(nz[-1]) + 2, len(values))
+
+
+def _group_proportional_rows(
+    hist: np.ndarray,
+) -> list[tuple[int, tuple[int, int], list[tuple[int, float]]]]:
+    """Group non-zero rows of `hist` that are scalar multiples of each other.
+
+    Returns `[(ref_row, (i0, i1), [(row, scale), ...]), ...]`: every member is zero outside
+    `[i0, i1)` and `hist[row] == scale * hist[ref_row]` (up to round-off), so each group
+    can share a single Path time series holding `hist[ref_row, i0:i1]`.
+    """
+    groups: dict[tuple[int, bytes], tuple[int, tuple[int, int], list[tuple[int, float]]]] = {}
+    ref_norm: dict[tuple[int, bytes], float] = {}
+    for row, values in enumerate(hist):
+        if not values.any():
+            continue
+        i0, i1 = _active_window(values)
+        window = values[i0:i1]
+        norm = float(np.linalg.norm(window))
+        key = (i0, np.round(window / norm, 12).tobytes())
+        if key not in groups:
+            groups[key] = (row, (i0, i1), [])
+            ref_norm[key] = norm
+        groups[key][2].append((row, norm / ref_norm[key]))
+    return list(groups.values())
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _accumulate_axle_loads_jit(hist, x_g, x_front, dists, loads, inv_dx):
+        """Numba version of `_accumulate_axle_loads_numpy` (same semantics)."""
+        n = x_g.shape[0]
+        x_lo, x_hi = x_g[0], x_g[-1]
+        for it in range(x_front.shape[0]):
+            for a in range(dists.shape[0]):
+                x_axle = x_front[it] + dists[a]
+                if x_axle < x_lo or x_axle > x_hi:
+                    continue
+                if inv_dx > 0.0:
+                    idx = int(np.floor((x_axle - x_lo) * inv_dx))
+                else:
+                    # bisection == np.searchsorted(x_g, x_axle) (side='left') - 1
+                    lo, hi = 0, n
+                    while lo < hi:
+                        mid = (lo + hi) // 2
+                        if x_g[mid] < x_axle:
+                            lo = mid + 1
+                        else:
+                            hi = mid
+                    idx = lo - 1
+                idx = min(max(idx, 0), n - 2)
+                # segment length inline: x_g is a strided column view, which np.diff rejects here
+                r = (x_axle - x_g[idx]) / (x_g[idx + 1] - x_g[idx])
+                hist[idx, it] += loads[a] * (1 - r)
+                hist[idx + 1, it] += loads[a] * r
+
+
+
+def _accumulate_axle_loads(
+    hist: np.ndarray,
+    x_g: np.ndarray,
+    x_front: np.ndarray,
+    dists: np.ndarray,
+    loads: np.ndarray,
+) -> None:
+    """Fill `hist` with the axle loads (Numba kernel if available, NumPy otherwise)."""
+    kernel = _accumulate_axle_loads_jit if njit is not None else _accumulate_axle_loads_numpy
+    kernel(hist, x_g, x_front, dists, loads, _uniform_inv_spacing(x_g))
+
+
 def run_moving_load(
     params: dict,
     output_dir: str | Path,
@@ -39,12 +176,14 @@ def run_moving_load(
     vehicle_loads_n: Tuple[float, ...] | None = None,
     vehicle_distances_mm: Tuple[float, ...] | None = None,
     make_plot: bool = True,
+    precomputed: Tuple[Any, Sequence[float]] | None = None,
 ):
-    if ops is None:  # pragma: no cover
-        raise ImportError('openseespy is required') from _OPENSEESPY_IMPORT_ERROR
-
     """Run the transient moving-load analysis and write midspan acceleration CSVs.
 
+    `precomputed=(bridge, eigen_values)` from `prepare_domain(params)` skips the model
+    build and the eigen solve and runs on the existing (unloaded) domain; the eigenvalues
+    are only used for the Rayleigh damping.
+
     Outputs (same as notebook)
     --------------------------
     - `<case_label>mid_accel_g3.csv`
@@ -54,23 +193,29 @@ def run_moving_load(
     -------
     (csv_path_g3, csv_path_g4)
     """
-    output_dir = ensure_dir(output_dir)
+    if ops is None:  # pragma: no cover
+        raise ImportError('openseespy is required') from _OPENSEESPY_IMPORT_ERROR
 
-    # Build the model (params are applied inside build_bridge_model)
-    build_bridge_model(params)
+    output_dir = ensure_dir(output_dir)
 
-    # Eigen extraction
-    numEigen = int(params.get("numEigen", 3))
-    eigen_value = ops.eigen(numEigen)
+    # Build the model (params are applied inside build_bridge_model) + eigen extraction
+    if precomputed is None:
+        build_bridge_model(params)
+        numEigen = int(params.get("numEigen", 3))
+        eigen_value = solve_eigen(numEigen, params.get("eigen_solver"))
+    else:
+        eigen_value = list(precomputed[1])
 
     # ------------------------------------------------------------
     # 0) Geometry setup
     # ------------------------------------------------------------
-    girder3 = _get_girder_tags(int(params.get("girder3_start_tag", 3001)), int(params.get("girder_n_nodes", 149)))
-    girder4 = _get_girder_tags(int(params.get("girder4_start_tag", 4001)), int(params.get("girder_n_nodes", 149)))
+    girder_n_nodes = int(params.get("girder_n_nodes", 149))
+    all_tags = np.array(ops.getNodeTags(), dtype=int)
+    girder3 = _get_girder_tags(all_tags, int(params.get("girder3_start_tag", 3001)), girder_n_nodes)
+    girder4 = _get_girder_tags(all_tags, int(params.get("girder4_start_tag", 4001)), girder_n_nodes)
 
-    coords_g3 = np.array([ops.nodeCoord(int(nd)) for nd in girder3], dtype=float)
-    coords_g4 = np.array([ops.nodeCoord(int(nd)) for nd in girder4], dtype=float)
+    coords_g3 = _node_coords(girder3)
+    coords_g4 = _node_coords(girder4)
     x_g3, y_g3 = coords_g3[:, 0], coords_g3[:, 1]
     x_g4, y_g4 = coords_g4[:, 0], coords_g4[:, 1]
     bridge_length = float(abs(x_g3[-1] - x_g3[0]))
@@ -97,37 +242,25 @@ def run_moving_load(
     dt = float(params.get("dt", 0.1))
     truck_length = abs(max(vehicle_config["distances"]))
     t_total = (bridge_length + truck_length) / speed
-    time_steps = np.arange(0, t_total + 5, dt)
+    # Free-decay tail after the truck leaves the bridge (notebook: 5 s; smaller = shorter run)
+    t_pad = float(params.get("t_decay_s", 5.0))
+    time_steps = np.arange(0, t_total + t_pad, dt)
 
     # ------------------------------------------------------------
-    # 2) Node-wise load history initialization
+    # 2) Node-wise load history initialization (rows follow girder node order)
     # ------------------------------------------------------------
-    node_load_history_g3 = {int(nd): np.zeros(len(time_steps), dtype=float) for nd in girder3}
-    node_load_history_g4 = {int(nd): np.zeros(len(time_steps), dtype=float) for nd in girder4}
+    hist_g3 = np.zeros((len(girder3), len(time_steps)), dtype=float)
+    hist_g4 = np.zeros((len(girder4), len(time_steps)), dtype=float)
 
     # ------------------------------------------------------------
-    # 3) Load history generation
+    # 3) Load history generation (axles 0-2 on girder3, 3-5 on girder4)
     # ------------------------------------------------------------
-    for it, t in enumerate(time_steps):
-        progress = speed * t
-
-        for i_ax, (dist, load_val) in enumerate(zip(vehicle_config["distances"], vehicle_config["loads"])):
-            if i_ax < 3:
-                x_axle = x_start_g3 - progress + dist
-                x_g, girder, node_hist = x_g3, girder3, node_load_history_g3
-            else:
-                x_axle = x_start_g4 - progress + dist
-                x_g, girder, node_hist = x_g4, girder4, node_load_history_g4
+    dists = np.asarray(vehicle_config["distances"], dtype=float)
+    loads = np.asarray(vehicle_config["loads"], dtype=float)
+    progress = speed * time_steps
 
-            if x_g[0] <= x_axle <= x_g[-1]:
-                idx = np.searchsorted(x_g, x_axle) - 1
-                idx = int(np.clip(idx, 0, len(girder) - 2))
-                xi, xj = x_g[idx], x_g[idx + 1]
-                nd_i, nd_j = int(girder[idx]), int(girder[idx + 1])
-                r = (x_axle - xi) / (xj - xi)
-
-                node_hist[nd_i][it] += load_val * (1 - r)
-                node_hist[nd_j][it] += load_val * r
+    _accumulate_axle_loads(hist_g3, x_g3, x_start_g3 - progress, dists[:3], loads[:3])
+    _accumulate_axle_loads(hist_g4, x_g4, x_start_g4 - progress, dists[3:], loads[3:])
 
     # ------------------------------------------------------------
     # 4) Analysis setup
@@ -165,31 +298,56 @@ def run_moving_load(
     # ------------------------------------------------------------
     # 6) Create PathSeries (node-wise, unique tags)
     # ------------------------------------------------------------
-    def create_pathseries_from_history(history_dict, girder_id: int):
-        for nd, values in history_dict.items():
-            if np.allclose(values, 0.0):
-                continue
-            ts_tag = 1000 * int(girder_id) + int(nd)
-            pat_tag = 2000 * int(girder_id) + int(nd)
-            ops.timeSeries("Path", ts_tag, "-dt", dt, "-values", *values.tolist(), "-factor", 1.0)
+    # Path values go through small text files (`-filePath`) rather than being unpacked
+    # into the OpenSees call as T separate Python arguments. The files live in a
+    # temporary directory (`ts_dir`, set below) that is removed after the analysis.
+    # On a uniform mesh the nodes see time-shifted copies of the same axle pulse, so
+    # identical windows share one values file and differ only in `-startTime`.
+    window_files: dict[bytes, Path] = {}
+
+    def create_pathseries_from_history(hist, girder, girder_id: int):
+        # Rows with the same temporal shape share one Path series; the amplitude goes
+        # into the nodal load factor (a singleton group is the notebook's per-node case).
+        # Only the active window is stored; the series is zero before `-startTime` and
+        # after its last sample.
+        tags = girder.tolist()  # plain Python ints for the OpenSees calls below
+        ts_base, pat_base = 1000 * int(girder_id), 2000 * int(girder_id)
+        ops_load = ops.load  # bound once; called for every loaded node
+        for ref_row, (i0, i1), members in _group_proportional_rows(hist):
+            ts_tag = ts_base + tags[ref_row]
+            pat_tag = pat_base + tags[ref_row]
+            window = hist[ref_row, i0:i1]
+            ts_path = window_files.get(window.tobytes())
+            if ts_path is None:
+                ts_path = ts_dir / f"{ts_tag}.txt"
+                np.savetxt(ts_path, window)
+                window_files[window.tobytes()] = ts_path
+            ops.timeSeries(
+                "Path", ts_tag, "-dt", dt, "-filePath", str(ts_path), "-factor", 1.0, "-startTime", i0 * dt
+            )
             ops.pattern("Plain", pat_tag, ts_tag)
-            # NOTE: load vector is scaled by the Path time series; keep -1.0 to preserve notebook convention.
-            ops.load(int(nd), 0.0, 0.0, -1.0, 0.0, 0.0, 0.0)
+            for row, scale in members:
+                # NOTE: load vector is scaled by the Path time series; keep -1.0 to preserve notebook convention.
+                ops_load(tags[row], 0.0, 0.0, -1.0 * scale, 0.0, 0.0, 0.0)
 
-    create_pathseries_from_history(node_load_history_g3, 3)
-    create_pathseries_from_history(node_load_history_g4, 4)
+    with tempfile.TemporaryDirectory(prefix="bridge_psci_ts_") as ts_tmp:
+        ts_dir = Path(ts_tmp)
+        create_pathseries_from_history(hist_g3, girder3, 3)
+        create_pathseries_from_history(hist_g4, girder4, 4)
 
-    # ------------------------------------------------------------
-    # 7) Run analysis
-    # ------------------------------------------------------------
-    ops.analyze(len(time_steps), dt)
+        # ------------------------------------------------------------
+        # 7) Run analysis
+        # ------------------------------------------------------------
+        ops.analyze(len(time_steps), dt)
 
     # ------------------------------------------------------------
     # 8) Optional plot (same as notebook scaling: g & 1000)
     # ------------------------------------------------------------
     if make_plot:
-        data_g3 = np.loadtxt(g3_path)
-        data_g4 = np.loadtxt(g4_path)
+        import matplotlib.pyplot as plt
+
+        data_g3 = _read_recorder(g3_path)
+        data_g4 = _read_recorder(g4_path)
 
         t = data_g3[:, 0]
         acc_g3 = data_g3[:, 1] / 9.81 / 1000
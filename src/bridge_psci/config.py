@@ -13,7 +13,9 @@ params = make_params(case="case2")
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -23,35 +25,50 @@ from .defaults_base import get_default_base_params
 # -------------------------
 # Defaults (lifted from notebook cells 6/7)
 # -------------------------
+# Bearing stiffness layout (rows A1_B1..B6, A2_B1..B6; columns k1..k6).
+# Codes: 0 = free, 1 = consts1, 2 = consts (1e9/1e3), 3 = consts_crack
+_BEARING_PATTERN = np.array([
+    [0, 1, 2, 0, 0, 0],  # A1_B1
+    [0, 1, 2, 0, 0, 0],  # A1_B2
+    [0, 1, 3, 0, 0, 0],  # A1_B3
+    [0, 1, 3, 0, 0, 0],  # A1_B4
+    [0, 1, 3, 0, 0, 0],  # A1_B5
+    [0, 1, 2, 0, 0, 0],  # A1_B6
+
+    [1, 0, 3, 0, 0, 0],  # A2_B1
+    [1, 0, 2, 0, 0, 0],  # A2_B2
+    [1, 0, 3, 0, 0, 0],  # A2_B3
+    [1, 0, 3, 0, 0, 0],  # A2_B4
+    [1, 0, 3, 0, 0, 0],  # A2_B5
+    [1, 1, 2, 0, 0, 0],  # A2_B6
+], dtype=np.int8)
+
+
+def _build_bearing_stiffness(consts1: float, consts_crack: float, bearing_multiplier: float) -> np.ndarray:
+    """Return the (12, 6) bearing stiffness table (A1_B1..B6, A2_B1..B6).
+
+    Only the abutment-1 rows are scaled by `bearing_multiplier` (notebook convention).
+    """
+    free = 0
+    consts = 1e9 / 1e3
+
+    values = np.array([free, consts1, consts, consts_crack], dtype=float)
+    rows = values[_BEARING_PATTERN]
+    rows[:6] *= bearing_multiplier
+    return rows
+
+
 def _default_params() -> Dict[str, Any]:
     base = get_default_base_params()
     girder_number = int(base.get('girder_number', 6))
 
-    free = 0
-    consts = 1e9 / 1e3
     consts1 = 80000
     consts_crack = 1e9 / 1e4
 
-    A1_B1 = [free, consts1, consts, 0, 0, 0]
-    A1_B2 = [free, consts1, consts, 0, 0, 0]
-    A1_B3 = [free, consts1, consts_crack, 0, 0, 0]
-    A1_B4 = [free, consts1, consts_crack, 0, 0, 0]
-    A1_B5 = [free, consts1, consts_crack, 0, 0, 0]
-    A1_B6 = [free, consts1, consts, 0, 0, 0]
-
-    A2_B1 = [consts1, free, consts_crack, 0, 0, 0]
-    A2_B2 = [consts1, free, consts, 0, 0, 0]
-    A2_B3 = [consts1, free, consts_crack, 0, 0, 0]
-    A2_B4 = [consts1, free, consts_crack, 0, 0, 0]
-    A2_B5 = [consts1, free, consts_crack, 0, 0, 0]
-    A2_B6 = [consts1, consts1, consts, 0, 0, 0]
-
     bearing_multiplier = 0.3
-    Bearing_Stiffness_A1 = np.vstack((A1_B1, A1_B2, A1_B3, A1_B4, A1_B5, A1_B6)) * bearing_multiplier
-    Bearing_Stiffness_A2 = np.vstack((A2_B1, A2_B2, A2_B3, A2_B4, A2_B5, A2_B6))
-    Bearing_Stiffness = np.vstack((Bearing_Stiffness_A1, Bearing_Stiffness_A2))
+    Bearing_Stiffness = _build_bearing_stiffness(consts1, consts_crack, bearing_multiplier)
 
-    params: Dict[str, Any] = dict(get_default_base_params())
+    params: Dict[str, Any] = base
     params.update(dict(
         # Material / stiffness sets
         E_girder1=[28000] * girder_number * 2,
@@ -76,8 +93,10 @@ def _default_params() -> Dict[str, Any]:
 
         # Modal/dynamic analysis knobs
         numEigen=3,
+        eigen_solver="-genBandArpack",
         zeta=0.015,
         dt=0.1,
+        t_decay_s=5.0,
         velocity_kmh=10,
 
         # Node-tag conventions used in notebook
@@ -115,8 +134,14 @@ def make_params(case: str = "baseline") -> Dict[str, Any]:
     -----
     - This is intentionally *thin* and close to the notebook behavior.
     - Further refactor target: replace this dict with dataclasses / YAML.
+    - Results are cached per case; each call returns an independent deep copy, so
+      callers may mutate the dict freely.
     """
-    case = case.strip().lower()
+    return copy.deepcopy(_make_params_cached(case.strip().lower()))
+
+
+@lru_cache(maxsize=8)
+def _make_params_cached(case: str) -> Dict[str, Any]:
     params = _default_params()
     girder_number = int(params.get('girder_number', 6))
 
@@ -134,28 +159,7 @@ def make_params(case: str = "baseline") -> Dict[str, Any]:
         bm = float(overrides["bearing_multiplier"])
         overrides.pop("bearing_multiplier", None)
 
-        free = 0
-        consts = 1e9 / 1e3
-        consts1 = params["consts1"]
-        consts_crack = params["consts_crack"]
-
-        A1_B1 = [free, consts1, consts, 0, 0, 0]
-        A1_B2 = [free, consts1, consts, 0, 0, 0]
-        A1_B3 = [free, consts1, consts_crack, 0, 0, 0]
-        A1_B4 = [free, consts1, consts_crack, 0, 0, 0]
-        A1_B5 = [free, consts1, consts_crack, 0, 0, 0]
-        A1_B6 = [free, consts1, consts, 0, 0, 0]
-
-        A2_B1 = [consts1, free, consts_crack, 0, 0, 0]
-        A2_B2 = [consts1, free, consts, 0, 0, 0]
-        A2_B3 = [consts1, free, consts_crack, 0, 0, 0]
-        A2_B4 = [consts1, free, consts_crack, 0, 0, 0]
-        A2_B5 = [consts1, free, consts_crack, 0, 0, 0]
-        A2_B6 = [consts1, consts1, consts, 0, 0, 0]
-
-        Bearing_Stiffness_A1 = np.vstack((A1_B1, A1_B2, A1_B3, A1_B4, A1_B5, A1_B6)) * bm
-        Bearing_Stiffness_A2 = np.vstack((A2_B1, A2_B2, A2_B3, A2_B4, A2_B5, A2_B6))
-        params["Bearing_Stiffness"] = np.vstack((Bearing_Stiffness_A1, Bearing_Stiffness_A2))
+        params["Bearing_Stiffness"] = _build_bearing_stiffness(params["consts1"], params["consts_crack"], bm)
         params["bearing_multiplier"] = bm
 
     # Normal overrides
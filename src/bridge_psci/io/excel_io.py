@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
@@ -7,84 +8,152 @@ from typing import Any, Dict, List, Tuple, Optional
 import json
 import numpy as np
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
+try:  # optional Rust-backed reader for the load path
+    from python_calamine import CalamineWorkbook  # type: ignore
+except Exception:  # pragma: no cover
+    CalamineWorkbook = None
+
+
 
 KV_HEADERS = ["Key", "Value", "Unit", "Type", "Description", "Required", "Example"]
 CASE_HEADERS = ["case_label", "key", "value", "type", "description"]
 BEARING_TABLE_HEADERS = ["bearing_id", "k1", "k2", "k3", "k4", "k5", "k6"]
+# Shared template styles (constructed once, not per header cell/sheet)
+HEADER_FILL = PatternFill("solid", fgColor="1F4E79")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+TITLE_FONT = Font(size=14, bold=True)
+
+# v3 key/value sheets (merged into params in workbook order)
+KV_SHEETS = frozenset({
+    "Meta", "Geometry", "Section", "Materials", "Tendon", "Bearings", "Modal", "Dynamic", "Vehicle", "Output", "Advanced"
+})
 
 
 def _style_header(ws, headers: List[str]):
     ws.append(headers)
-    header_fill = PatternFill("solid", fgColor="1F4E79")
-    header_font = Font(bold=True, color="FFFFFF")
-    for col, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=h)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    # style the row just appended (values are already written)
+    for cell in ws[1]:
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGN
+
+
+def _header_cells(ws, headers: List[str]) -> List[WriteOnlyCell]:
+    """Styled header row for a write-only sheet (same look as `_style_header`)."""
+    cells = []
+    for h in headers:
+        cell = WriteOnlyCell(ws, value=h)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGN
+        cells.append(cell)
+    return cells
+
+
+def _set_column_widths(ws, rows) -> None:
+    # One pass over the values; column width = longest entry + 2, clamped to [10, 70]
+    widths: List[int] = []
+    for row in rows:
+        if len(row) > len(widths):
+            widths.extend([0] * (len(row) - len(widths)))
+        for c, v in enumerate(row):
+            if v is not None:
+                n = len(str(v))
+                if n > widths[c]:
+                    widths[c] = n
+    for col, max_len in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = min(max(10, max_len + 2), 70)
 
 
 def _autosize(ws):
-    for col in range(1, ws.max_column + 1):
-        max_len = 0
-        for row in range(1, ws.max_row + 1):
-            v = ws.cell(row=row, column=col).value
-            if v is None:
-                continue
-            max_len = max(max_len, len(str(v)))
-        ws.column_dimensions[get_column_letter(col)].width = min(max(10, max_len + 2), 70)
+    _set_column_widths(ws, ws.iter_rows(values_only=True))
 
 
-def _parse_typed_value(raw: Any, typ: str | None) -> Any:
-    if raw is None:
-        return None
-    if typ is None or str(typ).strip() == "":
-        # leave as-is (openpyxl already gives numeric types)
+def _strip(s: Any) -> str:
+    # cells holding text are already str; only other types need str()
+    return s.strip() if isinstance(s, str) else ("" if s is None else str(s).strip())
+
+
+def _norm(s: Any) -> str:
+    return s.strip().lower() if isinstance(s, str) else ("" if s is None else str(s).strip().lower())
+
+
+def _as_bool(raw: Any) -> bool:
+    if isinstance(raw, bool):
         return raw
+    return _norm(raw) in {"1", "true", "t", "yes", "y"}
 
-    t = str(typ).strip().lower()
 
-    if t in {"str", "string"}:
-        return str(raw)
+def _as_int(raw: Any) -> int:
+    # openpyxl already returns numeric cells as int/float
+    if type(raw) is int:
+        return raw
+    if type(raw) is float:
+        return int(raw)
+    return int(float(raw))
 
-    if t in {"int", "integer"}:
-        return int(float(raw))
 
-    if t in {"float", "number"}:
-        return float(raw)
+def _as_float(raw: Any) -> float:
+    return raw if type(raw) is float else float(raw)
 
-    if t in {"bool", "boolean"}:
-        if isinstance(raw, bool):
-            return raw
-        s = str(raw).strip().lower()
-        return s in {"1", "true", "t", "yes", "y"}
 
-    # list handling: accept JSON list or comma-separated
-    if t.startswith("list"):
-        if isinstance(raw, list):
-            return raw
-        s = str(raw).strip()
-        if s == "":
-            return []
+def _as_json(raw: Any) -> Any:
+    return json.loads(str(raw))
+
+
+# Type column (lower-cased) -> parser
+_TYPE_HANDLERS = {
+    "str": str, "string": str,
+    "int": _as_int, "integer": _as_int,
+    "float": _as_float, "number": _as_float,
+    "bool": _as_bool, "boolean": _as_bool,
+    "json": _as_json, "dict": _as_json,
+}
+
+# Element parser for comma-separated list types
+_LIST_ITEM_HANDLERS = {
+    "list[int]": _as_int, "list[integer]": _as_int,
+    "list[float]": _as_float, "list[number]": _as_float,
+}
+
+
+def _parse_list(raw: Any, t: str) -> list:
+    # accept JSON list or comma-separated
+    if isinstance(raw, list):
+        return raw
+    s = str(raw).strip()
+    if s == "":
+        return []
+    if s[0] == "[":  # only a JSON array can parse to a list; skip the failing parse for CSV
         try:
             obj = json.loads(s)
             if isinstance(obj, list):
                 return obj
         except Exception:
             pass
-        parts = [p.strip() for p in s.split(",") if p.strip() != ""]
-        if t in {"list[int]", "list[integer]"}:
-            return [int(float(x)) for x in parts]
-        if t in {"list[float]", "list[number]"}:
-            return [float(x) for x in parts]
-        return parts
+    parts = [p.strip() for p in s.split(",") if p.strip() != ""]
+    item = _LIST_ITEM_HANDLERS.get(t)
+    return [item(x) for x in parts] if item is not None else parts
 
-    if t in {"json", "dict"}:
-        return json.loads(str(raw))
 
+def _parse_typed_value(raw: Any, typ: str | None) -> Any:
+    if raw is None:
+        return None
+    t = _norm(typ)
+    if t == "":
+        # leave as-is (openpyxl already gives numeric types)
+        return raw
+
+    handler = _TYPE_HANDLERS.get(t)
+    if handler is not None:
+        return handler(raw)
+    if t.startswith("list"):
+        return _parse_list(raw, t)
     return raw
 
 
@@ -98,14 +167,7 @@ def derive_section_from_dimensions(params: Dict[str, Any]) -> None:
     if not all(k in params for k in need):
         return
 
-    UF = float(params["UF"])
-    UT = float(params["UT"])
-    UFT = float(params["UFT"])
-    WH = float(params["WH"])
-    WT = float(params["WT"])
-    LT = float(params["LT"])
-    LF = float(params["LF"])
-    LFT = float(params["LFT"])
+    UF, UT, UFT, WH, WT, LT, LF, LFT = (float(params[k]) for k in need)
 
     # widths (mm)
     b1 = UF
@@ -139,56 +201,142 @@ def derive_bearing_stiffness(params: Dict[str, Any], bearings_table: Optional[Li
     - bearing_mode == 'multiplier' (default): multiply the baseline Bearing_Stiffness by bearing_multiplier
     - bearing_mode == 'table'      : replace Bearing_Stiffness with values from BearingsTable sheet
     """
-    mode = str(params.get("bearing_mode", "multiplier")).strip().lower()
+    mode = _norm(params.get("bearing_mode", "multiplier"))
 
     if mode == "table" and bearings_table is not None:
-        params["Bearing_Stiffness"] = bearings_table
+        params["Bearing_Stiffness"] = np.asarray(bearings_table, dtype=float)
         return
 
     # multiplier mode
     if "Bearing_Stiffness" in params and params.get("bearing_multiplier") is not None:
         m = float(params["bearing_multiplier"])
-        base = np.array(params["Bearing_Stiffness"], dtype=float)
-        params["Bearing_Stiffness"] = (base * m).tolist()
-
-
-def _read_kv_sheet(ws) -> Dict[str, Any]:
-    # Expect KV_HEADERS in row 1
-    key_col = 1
-    val_col = 2
-    type_col = 4
-    out: Dict[str, Any] = {}
-    for r in range(2, ws.max_row + 1):
-        key = ws.cell(r, key_col).value
-        if key is None or str(key).strip() == "":
+        # Kept as an ndarray (the builder indexes it row-wise); no list round-trip.
+        params["Bearing_Stiffness"] = np.asarray(params["Bearing_Stiffness"], dtype=float) * m
+
+
+def _calamine_value(v: Any) -> Any:
+    # match openpyxl: empty cells are None, whole numbers are int
+    if v == "":
+        return None
+    if type(v) is float and v.is_integer():
+        return int(v)
+    return v
+
+
+class _WorkbookReader:
+    """Data rows (below the header) of a workbook's sheets, padded to `ncols` with None.
+
+    Uses python-calamine when installed and openpyxl's read-only mode otherwise.
+    """
+
+    def __init__(self, excel_path: Path):
+        if CalamineWorkbook is not None:
+            self._book = CalamineWorkbook.from_path(str(excel_path))
+            self.sheetnames = list(self._book.sheet_names)
+            self._wb = None
+        else:
+            # read_only streams the sheets instead of building the full cell/style tree
+            self._wb = load_workbook(excel_path, data_only=True, read_only=True)
+            self.sheetnames = self._wb.sheetnames
+
+    def rows(self, name: str, ncols: int):
+        if self._wb is not None:
+            return self._wb[name].iter_rows(min_row=2, max_col=ncols, values_only=True)
+        pad = (None,) * ncols
+        data = self._book.get_sheet_by_name(name).to_python(skip_empty_area=False)
+        return (
+            (tuple(_calamine_value(v) for v in row[:ncols]) + pad)[:ncols]
+            for row in data[1:]
+        )
+
+    def close(self) -> None:
+        if self._wb is not None:
+            self._wb.close()
+        else:
+            self._book.close()
+
+
+def _read_kv_sheet_into(rows, out: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse KV sheet `rows` (Key, Value, Unit, Type) into `out` (later rows win) and return it."""
+    for key, raw_val, _unit, typ in rows:
+        key = _strip(key)
+        if key == "":
             continue
-        raw_val = ws.cell(r, val_col).value
-        typ = ws.cell(r, type_col).value
         val = _parse_typed_value(raw_val, typ)
         if val is None:
             continue
-        out[str(key).strip()] = val
+        out[key] = val
     return out
 
 
-def _read_bearings_table(ws) -> List[List[float]]:
-    # Expect BEARING_TABLE_HEADERS in row 1
-    rows: List[List[float]] = []
-    for r in range(2, ws.max_row + 1):
-        bid = ws.cell(r, 1).value
-        if bid is None or str(bid).strip() == "":
+def _read_bearings_table(rows) -> List[List[float]]:
+    # columns: BEARING_TABLE_HEADERS (bearing_id, k1..k6)
+    table: List[List[float]] = []
+    for bid, *k in rows:
+        if _strip(bid) == "":
             continue
-        k = []
-        for c in range(2, 8):
-            v = ws.cell(r, c).value
-            k.append(float(v) if v is not None else 0.0)
-        rows.append(k)
-    return rows
+        table.append([float(v) if v is not None else 0.0 for v in k])
+    return table
+
+
+def _read_cases(rows, wanted_case: str) -> Optional[Dict[str, Any]]:
+    """Return the overrides for `wanted_case` (lower-case label), or None if it has no rows."""
+    # columns: case_label, key, value, type (description is ignored)
+    overrides: Optional[Dict[str, Any]] = None
+    for case_label, key, raw_val, typ in rows:
+        if case_label is None or key is None:
+            continue
+        if _norm(case_label) != wanted_case:
+            continue
+        if overrides is None:
+            overrides = {}
+        overrides[_strip(key)] = _parse_typed_value(raw_val, typ)
+    return overrides
+
+
+@dataclass
+class _ParsedWorkbook:
+    is_v3: bool
+    kv: Dict[str, Any]                          # KV-sheet values, in merge order
+    bearings_table: Optional[List[List[float]]]
+    case_rows: Optional[List[tuple]]            # raw Cases rows; None without a Cases sheet
+
+
+# resolved path -> (st_mtime_ns, parsed workbook); re-saving the file invalidates the entry
+_PARSE_CACHE: Dict[Path, Tuple[int, _ParsedWorkbook]] = {}
+
+
+def _parse_workbook(excel_path: Path) -> _ParsedWorkbook:
+    wb = _WorkbookReader(excel_path)
+    try:
+        # Detect v3 template (presence of Geometry sheet)
+        sheet_set = set(wb.sheetnames)
+        is_v3 = "Geometry" in sheet_set and "Cases" in sheet_set
+
+        kv: Dict[str, Any] = {}
+        bearings_table = None
+        if is_v3:
+            for s in wb.sheetnames:
+                if s in KV_SHEETS:
+                    _read_kv_sheet_into(wb.rows(s, 4), kv)
+            if "BearingsTable" in sheet_set:
+                bearings_table = _read_bearings_table(wb.rows("BearingsTable", 7))
+        elif "Inputs" in sheet_set:
+            # v2 fallback: single-sheet Inputs (+ Cases)
+            _read_kv_sheet_into(wb.rows("Inputs", 4), kv)
+
+        case_rows = list(wb.rows("Cases", 4)) if "Cases" in sheet_set else None
+        return _ParsedWorkbook(is_v3, kv, bearings_table, case_rows)
+    finally:
+        wb.close()
 
 
 def load_params_from_excel(excel_path: str | Path, case: str = "baseline") -> Dict[str, Any]:
     """Load a parameter dict from the Excel template (v3 multi-sheet or v2 single-sheet).
 
+    The parsed workbook is cached per file (keyed by its modification time), so sweeping
+    several cases through the same workbook reads it only once.
+
     Parameters
     ----------
     excel_path:
@@ -203,120 +351,104 @@ def load_params_from_excel(excel_path: str | Path, case: str = "baseline") -> Di
     """
     from ..config import make_params
 
-    excel_path = Path(excel_path)
-    wb = load_workbook(excel_path, data_only=True)
+    excel_path = Path(excel_path).resolve()
+    mtime = excel_path.stat().st_mtime_ns
+    cached = _PARSE_CACHE.get(excel_path)
+    if cached is not None and cached[0] == mtime:
+        parsed = cached[1]
+    else:
+        parsed = _parse_workbook(excel_path)
+        _PARSE_CACHE[excel_path] = (mtime, parsed)
 
     # Start from programmatic defaults (ensures missing keys still exist)
     params = make_params(case="baseline")
-
-    # Detect v3 template (presence of Geometry sheet)
-    is_v3 = "Geometry" in wb.sheetnames and "Cases" in wb.sheetnames
-
-    # Merge base sheets
-    if is_v3:
-        kv_sheets = [s for s in wb.sheetnames if s in {
-            "Meta","Geometry","Section","Materials","Tendon","Bearings","Modal","Dynamic","Vehicle","Output","Advanced"
-        }]
-        for s in kv_sheets:
-            params.update(_read_kv_sheet(wb[s]))
-
-        bearings_table = None
-        if "BearingsTable" in wb.sheetnames:
-            bearings_table = _read_bearings_table(wb["BearingsTable"])
-
-        # Cases: apply overrides for the chosen case
-        case = str(case).strip().lower()
-        if "Cases" in wb.sheetnames:
-            overrides_by_case: Dict[str, Dict[str, Any]] = {}
-            ws = wb["Cases"]
-            # columns: case_label, key, value, type, description
-            for r in range(2, ws.max_row + 1):
-                case_label = ws.cell(r, 1).value
-                key = ws.cell(r, 2).value
-                if case_label is None or key is None:
-                    continue
-                case_label = str(case_label).strip().lower()
-                raw_val = ws.cell(r, 3).value
-                typ = ws.cell(r, 4).value
-                val = _parse_typed_value(raw_val, typ)
-                overrides_by_case.setdefault(case_label, {})[str(key).strip()] = val
-
-            if case in overrides_by_case:
-                params.update(overrides_by_case[case])
-            elif case not in {"baseline", "case1"}:
-                raise ValueError(f"Case '{case}' not found in Excel 'Cases' sheet.")
-
-        # Derived values
-        derive_section_from_dimensions(params)
-        derive_bearing_stiffness(params, bearings_table=bearings_table)
-        return params
-
-    # v2 fallback: single-sheet Inputs (+ Cases)
-    if "Inputs" in wb.sheetnames:
-        params.update(_read_kv_sheet(wb["Inputs"]))
-
-    if "Cases" in wb.sheetnames:
-        ws = wb["Cases"]
-        case = str(case).strip().lower()
-        overrides_by_case: Dict[str, Dict[str, Any]] = {}
-        for r in range(2, ws.max_row + 1):
-            case_label = ws.cell(r, 1).value
-            key = ws.cell(r, 2).value
-            if case_label is None or key is None:
-                continue
-            case_label = str(case_label).strip().lower()
-            raw_val = ws.cell(r, 3).value
-            typ = ws.cell(r, 4).value
-            val = _parse_typed_value(raw_val, typ)
-            overrides_by_case.setdefault(case_label, {})[str(key).strip()] = val
-        if case in overrides_by_case:
-            params.update(overrides_by_case[case])
-
+    # deep copy: lists in the cached values must not be shared with callers
+    params.update(copy.deepcopy(parsed.kv))
+
+    # Cases: apply overrides for the chosen case
+    case = _norm(case)
+    if parsed.case_rows is not None:
+        overrides = _read_cases(parsed.case_rows, case)
+        if overrides is not None:
+            params.update(overrides)
+        elif parsed.is_v3 and case not in {"baseline", "case1"}:
+            raise ValueError(f"Case '{case}' not found in Excel 'Cases' sheet.")
+
+    # Derived values
     derive_section_from_dimensions(params)
-    derive_bearing_stiffness(params, bearings_table=None)
+    derive_bearing_stiffness(params, bearings_table=parsed.bearings_table if parsed.is_v3 else None)
     return params
 
 
-def create_excel_template(excel_path: str | Path) -> Path:
+def create_excel_template(excel_path: str | Path, fast: bool = False) -> Path:
     """Create the **v3 multi-sheet** Excel template.
 
     The template starts from `bridge_psci.config.make_params('baseline')` defaults, so it will
     remain in-sync with your packaged notebook model.
+
+    With `fast=True` the workbook is streamed in openpyxl's write-only mode (column widths
+    are computed from the rows before they are written); the output is the same.
     """
     from ..config import make_params
 
     excel_path = Path(excel_path)
     params = make_params(case="baseline")
 
-    wb = Workbook()
-    # Remove default sheet
-    wb.remove(wb.active)
-
-    # README sheet
-    ws = wb.create_sheet("README")
-    ws["A1"] = "Bridge PSCI Excel Template (v3)"
-    ws["A1"].font = Font(size=14, bold=True)
-    ws["A3"] = "1) Fill sheets: Geometry / Section / Materials / Tendon / Bearings / Modal / Dynamic"
-    ws["A4"] = "2) Optional: edit BearingsTable (bearing_mode='table') or use bearing_multiplier (default)."
-    ws["A5"] = "3) Add scenario overrides in 'Cases' sheet (case_label, key, value, type)."
-    ws["A6"] = "4) Run: python scripts/run_excel.py --excel bridge_input_template.xlsx --case baseline"
-    ws.column_dimensions["A"].width = 110
+    wb = Workbook(write_only=fast)
+    if not fast:
+        # Remove default sheet
+        wb.remove(wb.active)
 
-    def add_kv_sheet(name: str, rows: List[Tuple[str, Any, str, str, str, str, str]]):
+    def write_sheet(name: str, headers: List[str], rows: List[Any]):
         ws = wb.create_sheet(name)
-        _style_header(ws, KV_HEADERS)
+        if fast:
+            # write-only sheets need widths/panes before the first row goes out
+            _set_column_widths(ws, [headers, *rows])
+            ws.freeze_panes = "A2"
+            ws.append(_header_cells(ws, headers))
+            for row in rows:
+                ws.append(list(row))
+            return
+        _style_header(ws, headers)
         for row in rows:
             ws.append(list(row))
         ws.freeze_panes = "A2"
         _autosize(ws)
 
+    # README sheet
+    ws = wb.create_sheet("README")
+    ws.column_dimensions["A"].width = 110
+    title = "Bridge PSCI Excel Template (v3)"
+    readme = [
+        "1) Fill sheets: Geometry / Section / Materials / Tendon / Bearings / Modal / Dynamic",
+        "2) Optional: edit BearingsTable (bearing_mode='table') or use bearing_multiplier (default).",
+        "3) Add scenario overrides in 'Cases' sheet (case_label, key, value, type).",
+        "4) Run: python scripts/run_excel.py --excel bridge_input_template.xlsx --case baseline",
+    ]
+    if fast:
+        title_cell = WriteOnlyCell(ws, value=title)
+        title_cell.font = TITLE_FONT
+        ws.append([title_cell])
+        ws.append([])
+        for line in readme:
+            ws.append([line])
+    else:
+        ws["A1"] = title
+        ws["A1"].font = TITLE_FONT
+        for r, line in enumerate(readme, 3):
+            ws.cell(row=r, column=1, value=line)
+
+    # openpyxl can't store lists/dicts directly -> serialize them to JSON once
+    cell_values = {k: json.dumps(v) if isinstance(v, (list, dict)) else v for k, v in params.items()}
+    known = set()  # keys given an explicit row on a KV sheet
+
+    def add_kv_sheet(name: str, rows: List[Tuple[str, Any, str, str, str, str, str]]):
+        known.update(row[0] for row in rows)
+        write_sheet(name, KV_HEADERS, rows)
+
     # Helper to build rows
     def row(key, unit="", typ="", desc="", required="Y", example=""):
-        val = params.get(key, "")
-        # openpyxl can't store lists/dicts directly -> write JSON string
-        if isinstance(val, (list, dict)):
-            val = json.dumps(val)
-        return (key, val, unit, typ, desc, required, example)
+        return (key, cell_values.get(key, ""), unit, typ, desc, required, example)
 
     add_kv_sheet("Meta", [
         ("project_name", "PSCI Bridge", "", "str", "Project label used for output folders", "N", "HyojaBridge_UP"),
@@ -377,11 +509,13 @@ def create_excel_template(excel_path: str | Path) -> Path:
 
     add_kv_sheet("Modal", [
         row("numEigen", "ea", "int", "Number of eigenvalues/modes", "Y", "3"),
+        row("eigen_solver", "", "str", "OpenSees eigen solver flag", "N", "-genBandArpack"),
         row("zeta", "-", "float", "Modal damping ratio", "Y", "0.015"),
     ])
 
     add_kv_sheet("Dynamic", [
         row("dt", "s", "float", "Time step", "Y", "0.1"),
+        row("t_decay_s", "s", "float", "Free-decay time simulated after the truck exits", "N", "5"),
         row("velocity_kmh", "km/h", "float", "Vehicle speed", "Y", "10"),
         row("load", "N", "float", "Vehicle axle/load parameter used in notebook", "N", ""),
         row("pave_thick", "mm", "list[float]", "Pavement thickness", "N", "[80]"),
@@ -394,44 +528,25 @@ def create_excel_template(excel_path: str | Path) -> Path:
     ])
 
     # Advanced sheet for any extra keys (keeps full coverage)
-    known = set()
-    for s in ["Geometry","Section","Materials","Tendon","Bearings","Modal","Dynamic","Output"]:
-        for r in wb[s].iter_rows(min_row=2, values_only=True):
-            if r and r[0]:
-                known.add(str(r[0]).strip())
-
     advanced_rows = []
     for k in sorted(params.keys()):
+        # `known` also holds the Meta keys (project_name, notes), which stay out of here
         if k in known:
             continue
-        # Exclude internal notes keys
-        if k in {"project_name","notes"}:
-            continue
-        val = params.get(k, "")
-        if isinstance(val, (list, dict)):
-            val = json.dumps(val)
-        advanced_rows.append((k, val, "", "", "", "N", ""))
+        advanced_rows.append((k, cell_values[k], "", "", "", "N", ""))
 
     add_kv_sheet("Advanced", advanced_rows[:200])  # keep workbook light; you can add more later
 
     # Cases sheet
-    ws = wb.create_sheet("Cases")
-    _style_header(ws, CASE_HEADERS)
-    ws.append(["baseline", "bearing_multiplier", 0.3, "float", "Example override"])
-    ws.freeze_panes = "A2"
-    _autosize(ws)
+    write_sheet("Cases", CASE_HEADERS, [["baseline", "bearing_multiplier", 0.3, "float", "Example override"]])
 
     # BearingsTable sheet (optional)
-    ws = wb.create_sheet("BearingsTable")
-    _style_header(ws, BEARING_TABLE_HEADERS)
     # Provide default ordering (12 bearings: A1_B1..B6, A2_B1..B6)
-    default_b = np.array(params.get("Bearing_Stiffness"), dtype=float)
+    default_b = np.asarray(params.get("Bearing_Stiffness"), dtype=float)
     bearing_ids = [f"A1_B{i}" for i in range(1,7)] + [f"A2_B{i}" for i in range(1,7)]
-    for i,bid in enumerate(bearing_ids):
-        rowvals = [bid] + [float(x) for x in default_b[i].tolist()]
-        ws.append(rowvals)
-    ws.freeze_panes = "A2"
-    _autosize(ws)
+    # one tolist() per row gives plain Python floats for openpyxl
+    bearing_rows = [[bid, *k.tolist()] for bid, k in zip(bearing_ids, default_b)]
+    write_sheet("BearingsTable", BEARING_TABLE_HEADERS, bearing_rows)
 
     excel_path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(excel_path)
@@ -44,6 +44,49 @@ class BuiltModel:
     params: Dict[str, Any]
     ctx: Dict[str, Any]
 
+
+def _shell_nodal_mass(X, Y, t_rows, rho):
+    """Lump shell mass onto a regular (strip, station) node grid.
+
+    `X`/`Y` are the node coordinate grids, shape (n_strips, imax); `t_rows` is the
+    plate thickness of each of the n_strips-1 element rows. Every node receives a
+    quarter of the mass of each adjacent element.
+    """
+    vol = t_rows[:, None] * (X[:-1, 1:] - X[:-1, :-1]) * (Y[1:, 1:] - Y[:-1, 1:]) * rho
+    quarter = vol / 4
+    row = np.zeros((vol.shape[0], X.shape[1]))
+    row[:, :-1] += quarter
+    row[:, 1:] += quarter
+    nodal = np.zeros(X.shape)
+    nodal[:-1] += row
+    nodal[1:] += row
+    return nodal
+
+
+def _merge_spacings(a, b):
+    """Sorted, unique union of two spacing arrays rounded to 3 decimals (m)."""
+    return np.union1d(np.round(np.asarray(a, dtype=float), 3), np.round(np.asarray(b, dtype=float), 3))
+
+
+def _sorted_indices(haystack, needles):
+    """Ascending indices of `needles` in the sorted, unique `haystack`.
+
+    Same result as `np.where(np.isin(haystack, needles))[0]`, via binary search.
+    Duplicate needles map to one index; a needle missing from `haystack` raises
+    ValueError instead of being dropped silently.
+    """
+    needles = np.unique(needles)
+    if needles.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if haystack.size == 0:
+        raise ValueError(f'values not found in grid: {needles.tolist()}')
+    idx = np.minimum(np.searchsorted(haystack, needles), haystack.size - 1)
+    found = haystack[idx] == needles
+    if not found.all():
+        raise ValueError(f'values not found in grid: {needles[~found].tolist()}')
+    return idx
+
+
 class Analysis():
     def __init__(self, length,  width, nums_girder, skew, params: dict | None = None):
         self.params = params or {}
@@ -65,6 +108,33 @@ class Analysis():
         self.width = width * self.m
         self.skew = skew
         self.L = length * self.m
+        # skew 삼각함수는 모델 전체에서 상수 -> 한 번만 계산
+        self._skew_rad = math.radians(self.skew)
+        self._tan_skew = math.tan(self._skew_rad)
+        self._cos_skew = math.cos(self._skew_rad)
+        self._sin_skew = math.sin(self._skew_rad)
+        self._node_coords: dict[int, tuple] = {}  # tag -> (x, y, z), _add_node로 생성한 노드
+        self._slab_section_cache: dict[tuple, int] = {}  # (Ec, v, t) -> section tag
+
+    def _add_node(self, tag, x, y, z):
+        """Create an OpenSees node and remember its coordinates."""
+        ops.node(tag, x, y, z)
+        self._node_coords[tag] = (x, y, z)
+
+    def _node_coord(self, tag):
+        """Coordinates of `tag`, from the local cache when this instance created it."""
+        coord = self._node_coords.get(tag)
+        return coord if coord is not None else tuple(ops.nodeCoord(tag))
+
+    def _slab_section(self, tag, Ec_slab, v, t):
+        """Define a slab plate section, reusing the tag of an identical one if present."""
+        key = (round(float(Ec_slab), 6), v, round(float(t), 6))
+        cached = self._slab_section_cache.get(key)
+        if cached is None:
+            # 0대신 rho를 넣으면 질량이 중복으로 들어감. 해당 단면요소는 자동으로 질량을 노드에 부여하는 기능을 가짐. 현재 내코드로 작성 
+            ops.section('ElasticMembranePlateSection', tag, Ec_slab, v, t, 0)
+            self._slab_section_cache[key] = cached = tag
+        return cached
 
     def girder(self, girder_number, Ec, Pe,  spacing):
         name = 'girder' + str(girder_number) + '_centroid' # 교축 방향 라인 별로 이름 정의.
@@ -88,15 +158,15 @@ class Analysis():
         division = int(L /self.m * 5)     ######## 길이 기준(Element)
         imax = division + 1   # element + 1 (노드 기준)
 
-        x_loc = -1 * spacing * np.tan(math.radians(self.skew)) * self.m          #교축방향
+        x_loc = -1 * spacing * self._tan_skew * self.m          #교축방향
         y_loc = spacing * self.m                                                 #교축직각
         centroid = yt3 #  거더 상연부터 도심까지 거리
                             #z1             y1         z2             y2       z3                 y3         z4              y4
-        section1 = [    int(-h1),    int(-b1/2),   int(0),        int(-b1/2), int(0),        int(b1/2), int(-h1),        int(b1/2) ]           #100(h1), 1000(b1)
-        section2 = [  int(-h1-h2),   int(-b3/2),  int(-h1),      int(-b1/2), int(-h1),     int(b1/2),  int(-h1-h2),   int(b3/2) ]           #100, (200, 400)
-        section3 = [ int(-h1-h3+h4), int(-b3/2), int(-h1-h2),    int(-b3/2), int(-h1-h2),   int(b3/2),  int(-h1-h3+h4),  int(b3/2) ]         #600, 200
-        section4 = [   int(-h1-h3),  int(-b5/2), int(-h1-h3+h4), int(-b3/2), int(-h1-h3+h4), int(b3/2), int(-h1-h3),    int(b5/2)]        #200, (200, 450)
-        section5 = [ int(-h1-h3-h5), int(-b5/2),   int(-h1-h3),   int(-b5/2), int(-h1-h3),   int(b5/2),int(-h1-h3-h5),    int(b5/2)]        #150, 450
+        section1 = (    int(-h1),    int(-b1/2),   int(0),        int(-b1/2), int(0),        int(b1/2), int(-h1),        int(b1/2) )           #100(h1), 1000(b1)
+        section2 = (  int(-h1-h2),   int(-b3/2),  int(-h1),      int(-b1/2), int(-h1),     int(b1/2),  int(-h1-h2),   int(b3/2) )           #100, (200, 400)
+        section3 = ( int(-h1-h3+h4), int(-b3/2), int(-h1-h2),    int(-b3/2), int(-h1-h2),   int(b3/2),  int(-h1-h3+h4),  int(b3/2) )         #600, 200
+        section4 = (   int(-h1-h3),  int(-b5/2), int(-h1-h3+h4), int(-b3/2), int(-h1-h3+h4), int(b3/2), int(-h1-h3),    int(b5/2))        #200, (200, 450)
+        section5 = ( int(-h1-h3-h5), int(-b5/2),   int(-h1-h3),   int(-b5/2), int(-h1-h3),   int(b5/2),int(-h1-h3-h5),    int(b5/2))        #150, 450
         sections = [section1, section2, section3, section4, section5]
         Acol = Ag * self.mm2
         ####################  Concrete MATERIAL   ########################################
@@ -128,37 +198,23 @@ class Analysis():
         muBeam = rho * Acol #N·s²/mm2
         nodes={}
         
-        mass_before = []
-        mass_after = []
-        
-        for j in range(0, imax): 
-            ops.node(int(1000 * girder_number+j+1), x_loc+L/division*j,  y_loc, -centroid)
-            mass_before.append(rho * Acol * L/division / 2)
-            mass_after.append(rho * Acol * L/division / 2)
-            
-        mass_before[-1] = 0
-        mass_after[0] = 0
-        mass_all = np.array(mass_before) + np.array(mass_after)
-        mass_all = mass_all.tolist()
-        
-        for j in range(0, imax):
-            ops.mass(int(1000 * girder_number+j+1),0,  0, mass_all[j])  # ops.mass는 kg단위가 아닌, N*s^2/mm 단위로 넣어줘야함. 따라서. kg -> 0.001을 곱해줌) 
-        
-       # 기존
-        # nodes[name] = np.c_[np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>=1000*girder_number],
-        #           np.asarray([(ops.nodeCoord(int(t))) for t in np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>=1000*girder_number]])]
+        js = np.arange(imax)
+        gid_tags = np.arange(1000 * girder_number + 1, 1000 * girder_number + imax + 1, dtype=np.int64)  # 생성 순서 = 태그 오름차순
+        dx = L/division
+        xs = x_loc + dx*js
 
-        # 수정: 거더별 노드 태그 하한/상한 범위 필터
-        tags = np.asarray(ops.getNodeTags(), dtype=int)
+        # 양 끝 노드는 요소 절반의 질량만 받음
+        m = rho * Acol * L/division
+        mass_all = np.full(imax, m)
+        mass_all[0] = mass_all[-1] = m / 2
 
-        # 이미 위에서 계산된 imax = division + 1 사용
-        lower = 1000 * girder_number + 1
-        upper = 1000 * girder_number + imax  # 포함 상한
+        # 노드 생성 직후 같은 태그에 질량 부여 (태그 오름차순)
+        for j in range(0, imax): 
+            self._add_node(int(gid_tags[j]), xs[j],  y_loc, -centroid)
+            ops.mass(int(gid_tags[j]),0,  0, float(mass_all[j]))  # ops.mass는 kg단위가 아닌, N*s^2/mm 단위로 넣어줘야함. 따라서. kg -> 0.001을 곱해줌) 
 
-        sel = (tags >= lower) & (tags <= upper)
-        gid_tags = np.sort(tags[sel])
-        coords = np.array([ops.nodeCoord(int(t)) for t in gid_tags], dtype=float)
-        nodes[name] = np.column_stack([gid_tags, coords])  # shape: (N, 1+3)
+        # 방금 생성한 좌표로 바로 구성 (getNodeTags/nodeCoord 재조회 없음)
+        nodes[name] = np.column_stack([gid_tags, xs, np.full(imax, y_loc), np.full(imax, -centroid)])  # shape: (N, 1+3)
 
         nfY1, nfZ1 = 2,5
         nfY2, nfZ2 = 1,2
@@ -166,47 +222,41 @@ class Analysis():
         nfY4, nfZ4 = 2,3
         nfY5, nfZ5 = 1,3
 
-        #실제 무게 반영해야함(모델로부터 오면 좋을 듯)
-        class Tendon():
-            def __init__(self):
-                pass
-            def tendon_profile_vertical(self, x ,coeffiecient, intercept):
-                x = np.array(x)
-                z = coeffiecient* x **2 +  intercept
-                return z
-            def tendon_profile_horizontal(self, x ,coeffiecient, intercept):
-                x = np.array(x)
-                z = coeffiecient* x **2 +  intercept
-                return z
-
-        quads = ['quad1', 'quad2', 'quad3', 'quad4', 'quad5']  # 단면 수 fiber
         a_coef = (z_coef_list-z_intercept_list) / tendon_horizontal_length / tendon_horizontal_length
         b_coef = (y_coef_list-y_intercept_list) / tendon_horizontal_length / tendon_horizontal_length
-        
+
+        # 모든 절점 x 텐던의 (z, y)를 한 번에 계산 (지간 중앙 기준 포물선)
+        xt2 = (L * np.arange(imax) / (imax - 1) - L / 2)[:, None] ** 2
+        Z_all = xt2 * a_coef[None, :number_tendon] + np.asarray(z_intercept_list[:number_tendon], dtype=float)[None, :] - girder_H
+        Y_all = xt2 * b_coef[None, :number_tendon] + np.asarray(y_intercept_list[:number_tendon], dtype=float)[None, :]
+
+        # 기본 patch 형상(단면 수 fiber 5개)은 절점과 무관 -> ops.patch 인자를 한 번만 구성
+        base_patch_calls = tuple((IDconcU, nfY, nfZ, *sec) for sec, nfY, nfZ in (
+            (section1, nfY1, nfZ1),
+            (section2, nfY2, nfZ2),
+            (section3, nfY3, nfZ3),
+            (section4, nfY4, nfZ4),
+            (section5, nfY5, nfZ5)))
+        sec_z_lo = np.array([sec[0] for sec in sections], dtype=float)
+        sec_z_hi = np.array([sec[2] for sec in sections], dtype=float)
+        # patch내에 있는지 확인( sec[0],[2]는 z값임), 밖의 텐던은 면적 0으로 배치
+        Zs = Z_all[:, None, :]
+        inside = (sec_z_lo[None, :, None] < Zs) & (Zs < sec_z_hi[None, :, None])
+        layer_args = np.empty((imax, len(sections), number_tendon, 5))
+        layer_args[..., 0] = np.where(inside, np.asarray(Ap_N[:number_tendon], dtype=float), 0.0)
+        layer_args[..., 1] = layer_args[..., 3] = Zs
+        layer_args[..., 2] = layer_args[..., 4] = Y_all[:, None, :]
+        layer_args = layer_args.tolist()
+
         for i in range(0, imax):
-            a = L * i / (imax - 1)
             ops.section('Fiber', int(nodes[name][i][0]), '-GJ', GJ)
-
-            sections1 = [
-            (section1, nfY1, nfZ1, 'quad1'),
-            (section2, nfY2, nfZ2, 'quad2'),
-            (section3, nfY3, nfZ3, 'quad3'),
-            (section4, nfY4, nfZ4, 'quad4'),
-            (section5, nfY5, nfZ5, 'quad5')]
-
-            for sec, nfY, nfZ, quad in sections1:
-                ops.patch('quad', IDconcU, nfY, nfZ, *sec)
-                for k in np.arange(1, 1+number_tendon).tolist():
-                    z = Tendon().tendon_profile_vertical(a - L / 2 , a_coef[k-1], z_intercept_list[k-1]) - girder_H
-                    if sec[0] < z < sec[2]: #patch내에 있는지 확인( sec[0],[2]는 z값임)
-                        y = Tendon().tendon_profile_horizontal(a - L / 2, b_coef[k-1], y_intercept_list[k-1])
-                        ops.layer('straight', IDstrand_initial, 1, Ap_N[k-1], z, y, z, y)
-                    else:
-                        y = Tendon().tendon_profile_horizontal(a - L / 2, b_coef[k-1], y_intercept_list[k-1])
-                        ops.layer('straight', IDstrand_initial, 1, 0, z, y, z, y)
+            for args, layers in zip(base_patch_calls, layer_args[i]):
+                ops.patch('quad', *args)
+                for layer in layers:
+                    ops.layer('straight', IDstrand_initial, 1, *layer)
 
         beam_el={}
-        beam_el[name]=np.array([],dtype=int)
+        beam_el[name]=np.empty(division, dtype=np.int64)
         numIntgrPts = 5
         
         for i in range(0, division, 1):
@@ -214,7 +264,7 @@ class Analysis():
             if i < imax+1:
                 ops.element('dispBeamColumn', int(nodes[name][i][0]), int(nodes[name][i][0]), int(nodes[name][i+1][0]), 
                     1000+girder_number, int(nodes[name][i][0])) #노드번호랑 요소 번호랑 동일 요소번호 = 노드-1 
-            beam_el[name]=np.append(beam_el[name], int(nodes[name][i][0]))
+            beam_el[name][i] = int(nodes[name][i][0])
             
         return nodes, beam_el
 
@@ -222,14 +272,16 @@ class Analysis():
         name = 'deck'
         L = self.L  # girder design length
         #bridge_width_spacings = np.arange(0, 12.5, 1, dtype = np.float32)-ex) (0,1,2,3,4,5,6,7,8,9,10,11,12)
-        slab_spacings = np.unique(np.round(np.sort(np.hstack([bridge_width_spacings, 
-            slab_thickness_spacing_cumsum])), 3))
+        slab_spacings = _merge_spacings(bridge_width_spacings, slab_thickness_spacing_cumsum)
         #array([ 0.  ,  1.  ,  1.25,  2.  ,  3.  ,  3.25,  4.  ,  5.  ,  5.25, 6.  ,  7.  ,  7.25,  8.  ,  9.  ,  9.25, 10.  , 11.  , 11.25, 12., 12.5 ])
-        slab_found_indices = np.where(np.isin(slab_spacings, slab_thickness_spacing_cumsum))[0]
+        slab_found_indices = _sorted_indices(slab_spacings, slab_thickness_spacing_cumsum)
 
         # cumsum이 존재하는 배열을 추출 -> [ 0,  2,  5,  8, 11, 14, 17, 19] -거더갯수+2(캔틸레버) 
         division = int(L / self.m * 5)
         imax = division + 1   # element + 1  --149
+        js = np.arange(imax)
+        dx = L/division
+        all_idx = np.arange(slab_found_indices[-1]+1)  # 구간별 strip 인덱스는 이 배열의 slice view로 사용
         spacing = slab_spacings * 1000
         
         name_list = []
@@ -239,23 +291,22 @@ class Analysis():
         nodes = {}
         for k in range(len(slab_found_indices)-1):
             if k != len(slab_found_indices)-2:
-                slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1]) #np.arrange(0,4) = [0,1,2,3] -> 슬라이싱 
-                spacing_list = slab_spacings[slicing_list]
+                slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]] #np.arrange(0,4) = [0,1,2,3] -> 슬라이싱 (view)
+                spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]]
             else:
-                slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1]+1)
-                spacing_list = slab_spacings[slicing_list]
+                slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]+1]
+                spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]+1]
                 
             for i in range(len(spacing_list)):
+                tags_i = pave_number * 100000 + 1000*slicing_list[i] + 1 + js
+                x_i = -1 *  1000*spacing_list[i] * self._tan_skew + dx*js
+                y_i = np.full(imax, 1000*float(spacing_list[i]))
+                z_i = np.full(imax, tSlab[0]/2 + 220, dtype=float) # 바닥판 두께를 더해줘야함.
                 for j in range(division+1):
-                    ops.node(int(pave_number * 100000 + 1000*slicing_list[i]+j+1),                     
-                             float(-1 *  1000*spacing_list[i] * np.tan(math.radians(self.skew))+L/division*j),                
-                             1000*float(spacing_list[i]),
-                             tSlab[0]/2 + 220 ) # 바닥판 두께를 더해줘야함.
-                    
-                    # 아래는 opensees에서 정의된 node를 딕셔너리 변수에 할당
-                nodes[name_list[slicing_list[i]]]=np.c_[np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>= pave_number * 100000 + 1000*slicing_list[i]],
-                                        np.asarray([(ops.nodeCoord(int(t))) for t in np.asarray(ops.getNodeTags())
-                                                 [np.asarray(ops.getNodeTags())>= pave_number * 100000 + 1000*slicing_list[i]]])]
+                    self._add_node(int(tags_i[j]), float(x_i[j]), float(y_i[j]), float(z_i[j]))
+
+                # 생성한 태그/좌표로 바로 딕셔너리 구성 (getNodeTags 재조회 없음)
+                nodes[name_list[slicing_list[i]]] = np.column_stack([tags_i, x_i, y_i, z_i])
 
         v = 0.1
         shell_el={}
@@ -265,51 +316,31 @@ class Analysis():
         rho = 2.0e-9  # N·s²/mm^4
         tSlab = np.array(tSlab)/2 + np.array(tSlab)/2
         for k in range(len(slab_found_indices)-1):  # 두께 변화구간 
-            slabSection = pave_number * 100 + 1 + k
             tSlabx = tSlab[0]
             Ec_slabx = Ec_slab[0]
-            ops.section('ElasticMembranePlateSection', slabSection, Ec_slabx, v, tSlabx, 0) # 0대신 rho를 넣으면 질량이 중복으로 들어감. 해당 단면요소는 자동으로 질량을 노드에 부여하는 기능을 가짐. 현재 내코드로 작성 
+            slabSection = self._slab_section(pave_number * 100 + 1 + k, Ec_slabx, v, tSlabx)  # 동일 두께/강성 구간은 단면 공유
 
-            slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1])
-            spacing_list = slab_spacings[slicing_list]
+            slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]]
+            spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]]
             for i in range(0, len(spacing_list)):
+                # 현재 strip / 다음 strip의 노드 태그 (Python int)
+                tags_a = nodes[name_list[slicing_list[i]]][:, 0].astype(np.int64).tolist()
+                tags_b = nodes[name_list[slicing_list[i]+1]][:, 0].astype(np.int64).tolist()
                 for j in range(1, imax, 1):
                     #element('ShellMITC4', eleTag, *eleNodes, secTag)
                     #a list of four element nodes in counter-clockwise order
-                    ops.element('ShellNLDKGQ', int(nodes[name_list[slicing_list[i]]][j-1,0]),
-                               *(np.asarray([nodes[name_list[slicing_list[i]]][j-1][0],
-                                             nodes[name_list[slicing_list[i]]][j][0],
-                                             nodes[name_list[slicing_list[i]+1]][j][0],
-                                             nodes[name_list[slicing_list[i]+1]][j-1][0]], dtype=(int))).tolist(), slabSection)
+                    ops.element('ShellNLDKGQ', tags_a[j-1],
+                               tags_a[j-1], tags_a[j], tags_b[j], tags_b[j-1], slabSection)
                     #shell_el[name] = np.append(shell_el[name], int(nodes[name_list[i]][j-1,0]))
                     
-        volume_list = []  # shell element별 부피 구하기
-        for k in range(len(slab_found_indices)-1):
-            tSlabx = tSlab[0]
-            slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1])
-            spacing_list = slab_spacings[slicing_list]
-            for i in range(0, len(spacing_list)):
-                for j in range(1, imax, 1):
-                    volume_list.append(tSlabx * (nodes[name_list[slicing_list[i]]][j][1] - nodes[name_list[slicing_list[i]]][j-1][1])*
-                                             (nodes[name_list[slicing_list[i]+1]][j][2] - nodes[name_list[slicing_list[i]]][j][2]))              
-        volume_list1 = np.array(volume_list).reshape(len(spacing)-1, -1) * rho
-        
-        volume_node_list = []
-        for i in range(0, len(volume_list1)):
-            a = np.insert(np.array(volume_list1[i]), 0, 0) / 4
-            b = np.insert(np.array(volume_list1[i]), len(volume_list1[i]), 0) / 4
-            volume_node_list.append(a + b)  
-        volume_node_list = np.array(volume_node_list)
-        
-        volume_node_list1 = []
-        for i in range(0, len(volume_node_list.T)):
-            a = np.insert(np.array(volume_node_list.T[i]), 0, 0)
-            b = np.insert(np.array(volume_node_list.T[i]), len(volume_node_list.T[i]), 0)
-            volume_node_list1.append(a+b)
-        volume_node_list1 =  np.array(volume_node_list1).T
-        for i in range(len(volume_node_list1)):
-            for j in range(len(volume_node_list1[i])):
-                ops.mass(int(nodes['pavement'+str(i)][j][0]), 0, 0, volume_node_list1[i][j])
+        # shell element별 부피 -> 절점 질량 (요소 질량의 1/4씩 인접 4절점에 분배)
+        grid = np.stack([nodes[name_list[i]] for i in range(len(spacing))])
+        t_rows = np.full(len(spacing)-1, tSlab[0])
+        nodal_mass = _shell_nodal_mass(grid[:, :, 1], grid[:, :, 2], t_rows, rho)
+        for i in range(len(spacing)):
+            tags_i = nodes[name_list[i]][:, 0]
+            for j in range(imax):
+                ops.mass(int(tags_i[j]), 0, 0, float(nodal_mass[i, j]))
 
         return nodes
     
@@ -317,12 +348,15 @@ class Analysis():
         name = 'deck'
         L = self.L  # girder design length
         #bridge_width_spacings = np.arange(0, 12.5, 1, dtype = np.float32)-ex) (0,1,2,3,4,5,6,7,8,9,10,11,12)
-        slab_spacings = np.unique(np.round(np.sort(np.hstack([bridge_width_spacings, slab_thickness_spacing_cumsum])), 3))
+        slab_spacings = _merge_spacings(bridge_width_spacings, slab_thickness_spacing_cumsum)
         #array([ 0.  ,  1.  ,  1.25,  2.  ,  3.  ,  3.25,  4.  ,  5.  ,  5.25, 6.  ,  7.  ,  7.25,  8.  ,  9.  ,  9.25, 10.  , 11.  , 11.25, 12., 12.5 ])
-        slab_found_indices = np.where(np.isin(slab_spacings, slab_thickness_spacing_cumsum))[0]
+        slab_found_indices = _sorted_indices(slab_spacings, slab_thickness_spacing_cumsum)
         # cumsum이 존재하는 배열을 추출 -> [ 0,  2,  5,  8, 11, 14, 17, 19] -거더갯수+2(캔틸레버) 
         division = int(L / self.m * 5)
         imax = division + 1   # element + 1  --149
+        js = np.arange(imax)
+        dx = L/division
+        all_idx = np.arange(slab_found_indices[-1]+1)  # 구간별 strip 인덱스는 이 배열의 slice view로 사용
         spacing = slab_spacings * 1000
         
         name_list = []
@@ -332,23 +366,22 @@ class Analysis():
         nodes = {}
         for k in range(len(slab_found_indices)-1):
             if k != len(slab_found_indices)-2:
-                slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1]) #np.arrange(0,4) = [0,1,2,3] -> 슬라이싱 
-                spacing_list = slab_spacings[slicing_list]
+                slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]] #np.arrange(0,4) = [0,1,2,3] -> 슬라이싱 (view)
+                spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]]
             else:
-                slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1]+1)
-                spacing_list = slab_spacings[slicing_list]
+                slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]+1]
+                spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]+1]
                 
             for i in range(len(spacing_list)):
+                tags_i = deck_number * 100000 + 1000*slicing_list[i] + 1 + js
+                x_i = -1 *  1000*spacing_list[i] * self._tan_skew + dx*js
+                y_i = np.full(imax, 1000*float(spacing_list[i]))
+                z_i = np.full(imax, tSlab[k]/2, dtype=float)
                 for j in range(division+1):
-                    ops.node(int(deck_number * 100000 + 1000*slicing_list[i]+j+1),                     
-                             float(-1 *  1000*spacing_list[i] * np.tan(math.radians(self.skew))+L/division*j),                
-                             1000*float(spacing_list[i]),
-                             tSlab[k]/2)
-                    
-                    # 아래는 opensees에서 정의된 node를 딕셔너리 변수에 할당
-                nodes[name_list[slicing_list[i]]]=np.c_[np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>= deck_number * 100000 + 1000*slicing_list[i]],
-                                        np.asarray([(ops.nodeCoord(int(t))) for t in np.asarray(ops.getNodeTags())
-                                                 [np.asarray(ops.getNodeTags())>= deck_number * 100000 + 1000*slicing_list[i]]])]
+                    self._add_node(int(tags_i[j]), float(x_i[j]), float(y_i[j]), float(z_i[j]))
+
+                # 생성한 태그/좌표로 바로 딕셔너리 구성 (getNodeTags 재조회 없음)
+                nodes[name_list[slicing_list[i]]] = np.column_stack([tags_i, x_i, y_i, z_i])
 
         v = 0.17
         shell_el={}
@@ -358,51 +391,31 @@ class Analysis():
         rho = 2.5e-9  # N·s²/mm^4
         tSlab = np.array(tSlab[:-1])/2 + np.array(tSlab[1:])/2
         for k in range(len(slab_found_indices)-1):  # 두께 변화구간 
-            slabSection = deck_number * 100 + 1 + k
             tSlabx = tSlab[k]
             Ec_slabx = Ec_slab[k]
-            ops.section('ElasticMembranePlateSection', slabSection, Ec_slabx, v, tSlabx, 0) # 0대신 rho를 넣으면 질량이 중복으로 들어감. 해당 단면요소는 자동으로 질량을 노드에 부여하는 기능을 가짐. 현재 내코드로 작성 
+            slabSection = self._slab_section(deck_number * 100 + 1 + k, Ec_slabx, v, tSlabx)  # 동일 두께/강성 구간은 단면 공유
 
-            slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1])
-            spacing_list = slab_spacings[slicing_list]
+            slicing_list = all_idx[slab_found_indices[k]:slab_found_indices[k+1]]
+            spacing_list = slab_spacings[slab_found_indices[k]:slab_found_indices[k+1]]
             for i in range(0, len(spacing_list)):
+                # 현재 strip / 다음 strip의 노드 태그 (Python int)
+                tags_a = nodes[name_list[slicing_list[i]]][:, 0].astype(np.int64).tolist()
+                tags_b = nodes[name_list[slicing_list[i]+1]][:, 0].astype(np.int64).tolist()
                 for j in range(1, imax, 1):
                     #element('ShellMITC4', eleTag, *eleNodes, secTag)
                     #a list of four element nodes in counter-clockwise order
-                    ops.element('ShellNLDKGQ', int(nodes[name_list[slicing_list[i]]][j-1,0]),
-                               *(np.asarray([nodes[name_list[slicing_list[i]]][j-1][0],
-                                             nodes[name_list[slicing_list[i]]][j][0],
-                                             nodes[name_list[slicing_list[i]+1]][j][0],
-                                             nodes[name_list[slicing_list[i]+1]][j-1][0]], dtype=(int))).tolist(), slabSection)
+                    ops.element('ShellNLDKGQ', tags_a[j-1],
+                               tags_a[j-1], tags_a[j], tags_b[j], tags_b[j-1], slabSection)
                     #shell_el[name] = np.append(shell_el[name], int(nodes[name_list[i]][j-1,0]))
                     
-        volume_list = []  # shell element별 부피 구하기
-        for k in range(len(slab_found_indices)-1):
-            tSlabx = tSlab[k]
-            slicing_list = np.arange(slab_found_indices[k], slab_found_indices[k+1])
-            spacing_list = slab_spacings[slicing_list]
-            for i in range(0, len(spacing_list)):
-                for j in range(1, imax, 1):
-                    volume_list.append(tSlabx * (nodes[name_list[slicing_list[i]]][j][1] - nodes[name_list[slicing_list[i]]][j-1][1])*
-                                             (nodes[name_list[slicing_list[i]+1]][j][2] - nodes[name_list[slicing_list[i]]][j][2]))              
-        volume_list1 = np.array(volume_list).reshape(len(spacing)-1, -1) * rho
-        
-        volume_node_list = []
-        for i in range(0, len(volume_list1)):
-            a = np.insert(np.array(volume_list1[i]), 0, 0) / 4
-            b = np.insert(np.array(volume_list1[i]), len(volume_list1[i]), 0) / 4
-            volume_node_list.append(a + b)  
-        volume_node_list = np.array(volume_node_list)
-        
-        volume_node_list1 = []
-        for i in range(0, len(volume_node_list.T)):
-            a = np.insert(np.array(volume_node_list.T[i]), 0, 0)
-            b = np.insert(np.array(volume_node_list.T[i]), len(volume_node_list.T[i]), 0)
-            volume_node_list1.append(a+b)
-        volume_node_list1 =  np.array(volume_node_list1).T
-        for i in range(len(volume_node_list1)):
-            for j in range(len(volume_node_list1[i])):
-                ops.mass(int(nodes['slab'+str(i)][j][0]), 0, 0, volume_node_list1[i][j])
+        # shell element별 부피 -> 절점 질량 (요소 질량의 1/4씩 인접 4절점에 분배)
+        grid = np.stack([nodes[name_list[i]] for i in range(len(spacing))])
+        t_rows = np.repeat(tSlab[:len(slab_found_indices)-1], np.diff(slab_found_indices))
+        nodal_mass = _shell_nodal_mass(grid[:, :, 1], grid[:, :, 2], t_rows, rho)
+        for i in range(len(spacing)):
+            tags_i = nodes[name_list[i]][:, 0]
+            for j in range(imax):
+                ops.mass(int(tags_i[j]), 0, 0, float(nodal_mass[i, j]))
 
         return nodes
     
@@ -414,41 +427,38 @@ class Analysis():
         #plate model 기준... 메쉬 크기를 어떻게 하는게 좋을까??
         y_loc = spacing * self.m
         name = 'guard' + str(number)
-        deck_thickness = np.array(deck_thickness)
-        pave_thick = np.array(pave_thick[0]);
+        deck_thickness = float(deck_thickness)
+        pave_thick = float(pave_thick[0])
         height =  height * self.m
         width = width * self.m
-        width1 = np.abs(width) 
+        width1 = abs(width) 
         A_guard = width1 * height
-        x_loc = -(y_loc + width/2) * np.tan(math.radians(self.skew))
+        x_loc = -(y_loc + width/2) * self._tan_skew
+        dx = L/division
+        guard_tags = 1000000 + 10000*number + 1 + np.arange(imax)
+        xs = x_loc + dx*np.arange(imax)
+        ys = np.full(imax, y_loc + width/2)
+        zs = np.full(imax, height / 2 + deck_thickness + pave_thick)
 
         nodes={}
         rho = 2.5e-9 # N·s²/mm^4
-        mass_before = []
-        mass_after = []
+        # 양 끝 노드는 요소 절반의 질량만 받음
+        m = rho * A_guard * L/division
+        mass_all = np.full(imax, m)
+        mass_all[0] = mass_all[-1] = m / 2
         
         for j in range(imax):
-            ops.node(1000000 + 10000*number+j+1, x_loc+L/division*j, y_loc + width/2, height / 2 + deck_thickness + pave_thick)
-            mass_before.append(rho * A_guard * L/division / 2)
-            mass_after.append(rho * A_guard * L/division / 2)
-                     
-        mass_before[-1] = 0
-        mass_after[0] = 0
-        mass_all = np.array(mass_before) + np.array(mass_after)
-        mass_all = mass_all.tolist()
-        
-        for j in range(0, imax):
-            ops.mass(int(1000000 + 10000*number+j+1),0,  0, mass_all[j])
+            self._add_node(int(guard_tags[j]), float(xs[j]), float(ys[j]), float(zs[j]))
+            ops.mass(int(guard_tags[j]),0,  0, float(mass_all[j]))
 
-        # 아래는 opensees에서 정의된 node를 딕셔너리 변수에 할당
-        nodes[name]=np.c_[np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>=1000000 + 10000*number],
-            np.asarray([(ops.nodeCoord(int(t))) for t in np.asarray(ops.getNodeTags())[np.asarray(ops.getNodeTags())>=1000000 + 10000*number]])]
+        # 생성한 태그/좌표 배열로 바로 딕셔너리 구성
+        nodes[name] = np.column_stack([guard_tags, xs, ys, zs])
 
         transfArgs = [0,0,1]
         ops.geomTransf(self.transftype,10 + number, *transfArgs)
         numIntgrPts = 5
         beam_el = {}
-        beam_el[name]=np.array([],dtype=int)
+        beam_el[name]=np.empty(imax-1, dtype=np.int64)
 
         A_guard = width1 * height
         Iz_guard = width1 * height * height* height / 12
@@ -466,7 +476,7 @@ class Analysis():
             ops.beamIntegration('Legendre', int(nodes[name][i-2][0]), guardSection, numIntgrPts)
             ops.element('dispBeamColumn', int(nodes[name][i-2][0]), int(nodes[name][i-2][0]), int(nodes[name][i-1][0]),
                         10 + number, int(nodes[name][i-2][0]))
-            beam_el[name]=np.append(beam_el[name],int(nodes[name][i-2][0]))
+            beam_el[name][i-2] = int(nodes[name][i-2][0])
 
         return nodes, beam_el
 
@@ -474,14 +484,13 @@ class Analysis():
         p = self.params
         girder_spacing = list(p['girder_spacing']) if isinstance(p['girder_spacing'], list) else [float(p['girder_spacing'])]
 
-        nodes= np.array([])
+        node_list = []
 
-        length = girder_spacing[0] / math.cos(math.radians(self.skew)) * self.m # 가로보 길이 
+        length = girder_spacing[0] / self._cos_skew * self.m # 가로보 길이 
         height = 1.795 * self.m
         thickness = 0.30 * self.m
-        theta = math.radians(self.skew)
         
-        transfArgs= [0, -math.sin(theta), math.cos(theta)]
+        transfArgs= [0, -self._sin_skew, self._cos_skew]
         numIntgrPts = 5
 
         A_diaphragm = height * thickness      
@@ -493,35 +502,29 @@ class Analysis():
         fc = -24 * self.MPa
         rho = 2.5e-9
         
-        mass_before = []
-        mass_after = []
+        # 양 끝 거더 위치의 노드는 가로보 한 칸 질량의 절반만 받음
+        m = rho * A_diaphragm * length
+        mass_all = np.full(nums_girder, m)
+        mass_all[0] = mass_all[-1] = m / 2
+
         for i in range(1, 1 + nums_girder):
-            ops.node(bridge_number * 100 + 10 *number + i, ops.nodeCoord(node[i-1])[0], ops.nodeCoord(node[i-1])[1], -height/2)
-            nodes = np.append(nodes, int(bridge_number * 100 + 10 * number + i))
-            mass_before.append(rho * A_diaphragm * length / 2)
-            mass_after.append(rho * A_diaphragm * length / 2)
+            tag = bridge_number * 100 + 10 *number + i
+            x, y, _ = self._node_coord(node[i-1])
+            self._add_node(tag, x, y, -height/2)
+            ops.mass(tag, 0,  0, float(mass_all[i-1]))
+            node_list.append(tag)
             
-        mass_before[-1] = 0
-        mass_after[0] = 0
-        mass_all = np.array(mass_before) + np.array(mass_after)
-        mass_all = mass_all.tolist()   
-        
-        for i in range(len(nodes)):
-            ops.mass(int(nodes[i].tolist()), 0,  0, mass_all[i])
+        nodes = np.fromiter(node_list, dtype=np.int64, count=len(node_list))
 
         for i in range(1, nums_girder, 1):
-            name = 'diaphragm' + str(bridge_number * 100 + 10 *number + i)
             ops.geomTransf(self.transftype, bridge_number * 100 + 10 *number + i, *transfArgs)
             
-            beam_el = {}
-            beam_el[name]=np.array([],dtype=int)
             Ec1 =  Ec[i-1]
             G = Ec1 / 2 / (1+v)
             diaphragm_Section = bridge_number * 100 + 10 * number + i
             ops.section('Elastic', diaphragm_Section, Ec1, A_diaphragm, Iz_diaphragm, Iy_diaphragm, G, J_diaphragm)
             ops.beamIntegration('Legendre', bridge_number * 100 + 10 *number + i, diaphragm_Section, numIntgrPts)
             ops.element('dispBeamColumn', bridge_number * 100 + 10 *number + i, bridge_number * 100 + 10 *number + i, bridge_number * 100 + 10 *number + i + 1, bridge_number * 100 + 10 *number + i, bridge_number * 100 + 10 *number + i)
-            beam_el[name]=np.append(beam_el[name], bridge_number * 100 + 10 *number + i)
             
         return nodes
 
@@ -556,11 +559,10 @@ class Analysis():
         spring_node = 100000000 + spring_number
 
         ####아래는 지점를 위한 노드
-        ops.node(support_node,
-                ops.nodeCoord(node)[0], ops.nodeCoord(node)[1], -int(h))
+        x, y, _ = self._node_coord(node)
+        self._add_node(support_node, x, y, -int(h))
         ####아래는 지점 스프링 요소를 위한 노드
-        ops.node(spring_node,
-                ops.nodeCoord(node)[0], ops.nodeCoord(node)[1], -int(h))
+        self._add_node(spring_node, x, y, -int(h))
 
         ops.element('zeroLength', support_node ,         spring_node, support_node, '-mat', IDhspring_axis,        '-dir', 1)     ## 교축임(가정)
         ops.element('zeroLength', support_node + 100,    spring_node, support_node, '-mat', IDhspring_transverse,  '-dir', 2)  # 'dir'에서 1이 교축인지 2가 교축인지 찾아야함(2가 없어도 해석이 돌아감)
@@ -652,81 +654,92 @@ def build_bridge_model(params: Dict[str, Any]) -> 'BuiltModel':
 
     Left_Cantil, Right_Cantil = Left_Cantilever, Right_Cantilever
     spacing = girder_spacing
-    girder_spacings = np.hstack([Left_Cantil, spacing*(nums_girder - 1)])
+    # [좌측 캔틸레버, 거더 간격...] / [0, 거더 간격 배열, 우측 캔틸레버] -- 크기를 알고 있으므로 미리 할당
+    inner_spacings = spacing*(nums_girder - 1)
+    girder_spacings = np.empty(1 + len(inner_spacings))
+    girder_spacings[0] = Left_Cantil
+    girder_spacings[1:] = inner_spacings
     girder_spacing_cumsum = np.round(np.cumsum(girder_spacings), 3)
-    slab_thickness_spacing = np.hstack([0.0, girder_spacings, Right_Cantilever])
+    slab_thickness_spacing = np.empty(len(girder_spacings) + 2)
+    slab_thickness_spacing[0] = 0.0
+    slab_thickness_spacing[1:-1] = girder_spacings
+    slab_thickness_spacing[-1] = Right_Cantilever
     slab_thickness_spacing_cumsum = np.round(np.cumsum(slab_thickness_spacing), 3)
-    bridge_width_spacings = np.arange(0, Bridge_width, 1.0, dtype=np.float32)
-    slab_spacings = np.unique(np.round(np.sort(np.hstack([bridge_width_spacings, slab_thickness_spacing_cumsum])), 3))
-    girder_found_indices = np.where(np.isin(slab_spacings, girder_spacing_cumsum))[0]
-    slab_found_indices = np.where(np.isin(slab_spacings, slab_thickness_spacing_cumsum))[0]
+    bridge_width_spacings = np.arange(0, Bridge_width, 1.0)
+    slab_spacings = _merge_spacings(bridge_width_spacings, slab_thickness_spacing_cumsum)
+    girder_found_indices = _sorted_indices(slab_spacings, girder_spacing_cumsum)
+    slab_found_indices = _sorted_indices(slab_spacings, slab_thickness_spacing_cumsum)
+
+    # ctx/deck 딕셔너리 키는 한 번만 만들어 두고 루프에서 인덱싱
+    girder_keys = [f'girder{i}' for i in range(1, nums_girder+1)]
+    spring_keys = [f'spring{i}' for i in range(1, 2*nums_girder+1)]
+    slab_keys = [f'slab{k}' for k in girder_found_indices]
 
     for i in range(1, nums_girder+1):
-        ctx['girder'+str(i)] = Bridge1.girder(i, E_girder1[i-1], PE, girder_spacing_cumsum[i-1])
+        ctx[girder_keys[i-1]] = Bridge1.girder(i, E_girder1[i-1], PE, girder_spacing_cumsum[i-1])
+    # 거더별 도심 노드 태그 (Python int list) -- 아래 스프링/링크 루프에서 재사용
+    centroid_tags = [ctx[key][0][key+'_centroid'][:, 0].astype(np.int64).tolist() for key in girder_keys]
 
     deck1 = Bridge1.deck(1, thickness1, E_deck1, bridge_width_spacings, slab_thickness_spacing_cumsum)
     barrier1 = Bridge1.barrier(1, slab_spacings[0], 25000, thickness1[0], pave_thick, 0.3, 3.88)
 
-    node_number = []
-    for i in range(1, girder_number+1):
-        node_number.append(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0])
-    node_array = np.array(node_number, dtype=np.int16).T
+    # 위치(j) × 거더(i) 도심 노드 태그 -- 위에서 [:, 0] 열로 뽑아 둔 centroid_tags 재사용
+    node_array = np.asarray(centroid_tags, dtype=np.int64).T
 
-    diaphragm_start1 = Bridge1.diaphragm(1, 1, node_array[0].tolist(), diaphragm1_Ec, nums_girder)
-    diaphragm_end1 = Bridge1.diaphragm(1, 2, node_array[-1].tolist(), diaphragm2_Ec, nums_girder)
+    diaphragm_start1 = Bridge1.diaphragm(1, 1, node_array[0], diaphragm1_Ec, nums_girder)
+    diaphragm_end1 = Bridge1.diaphragm(1, 2, node_array[-1], diaphragm2_Ec, nums_girder)
 
     crossbeam_list = [5000.0, 10000.0, 15000, 20000, 25000]
-    x_coords_array = []
     division = int(girder_length / 1000 * 5)
     imax = division + 1
-    for j in range(imax):
-        x_coords_array.append(girder_length/division*j)
+    x_coords_array = (girder_length/division)*np.arange(imax)
 
-    crossbeam_index = np.where(np.isin(x_coords_array, crossbeam_list))
-    for idx, tag in enumerate(crossbeam_index[0]):
-        ctx[f'crossbeam{idx+1}_1'] = Bridge1.diaphragm(1, 3+idx, node_array[tag].tolist(), diaphragm2_Ec, nums_girder)
+    crossbeam_index = _sorted_indices(x_coords_array, crossbeam_list)
+    xbeam_keys = [f'crossbeam{idx+1}_1' for idx in range(len(crossbeam_index))]
+    for idx, tag in enumerate(crossbeam_index):
+        ctx[xbeam_keys[idx]] = Bridge1.diaphragm(1, 3+idx, node_array[tag], diaphragm2_Ec, nums_girder)
 
     for i in range(1, nums_girder+1):
-        ctx['spring'+str(i*2-1)] = Bridge1.spring(i*2-1, int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][0]), girder_H, Bearing_Stiffness[i-1])
-        ctx['spring'+str(i*2)] = Bridge1.spring(i*2, int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][-1]), girder_H, Bearing_Stiffness[nums_girder+i-1])
+        ctx[spring_keys[i*2-2]] = Bridge1.spring(i*2-1, centroid_tags[i-1][0], girder_H, Bearing_Stiffness[i-1])
+        ctx[spring_keys[i*2-1]] = Bridge1.spring(i*2, centroid_tags[i-1][-1], girder_H, Bearing_Stiffness[nums_girder+i-1])
 
-    imax = len(ctx['girder1'][0]['girder1_centroid'])
+    imax = len(centroid_tags[0])
+    links = []  # rigidLink('beam', a, b) 쌍을 모아 마지막에 한 번에 생성
     for i in range(nums_girder):
-        for j in range(imax):
-            ops.rigidLink('beam',
-                int(ctx['girder'+str(i+1)][0]['girder'+str(i+1)+'_centroid'].T[0][j]),
-                int(deck1['slab'+str(girder_found_indices[i])].T[0][j]))
+        slab_i = deck1[slab_keys[i]][:, 0].astype(np.int64).tolist()
+        links.extend(zip(centroid_tags[i][:imax], slab_i[:imax]))
 
-    for j in range(imax):
-        ops.rigidLink('beam', int(deck1['slab0'].T[0][j]), int(barrier1[0]['guard1'][j][0]))
+    slab0 = deck1['slab0'][:, 0].astype(np.int64).tolist()
+    guard1 = barrier1[0]['guard1'][:, 0].astype(np.int64).tolist()
+    links.extend(zip(slab0[:imax], guard1[:imax]))
 
+    fix = ops.fix
     for i in range(1, nums_girder+1):
-        ops.fix(ctx['spring'+str(i*2-1)][0], 1,1,1,1,1,1)
-        ops.fix(ctx['spring'+str(i*2)][0], 1,1,1,1,1,1)
-        ops.rigidLink('beam',
-            int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][0]),
-            ctx['spring'+str(i*2-1)][1])
-        ops.rigidLink('beam',
-            int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][-1]),
-            ctx['spring'+str(i*2)][1])
+        spring_a, spring_b = ctx[spring_keys[i*2-2]], ctx[spring_keys[i*2-1]]
+        fix(spring_a[0], 1,1,1,1,1,1)
+        fix(spring_b[0], 1,1,1,1,1,1)
+        links.append((centroid_tags[i-1][0], spring_a[1]))
+        links.append((centroid_tags[i-1][-1], spring_b[1]))
 
+    add_link, _int = links.append, int
     for i in range(1, girder_number+1):
-        ops.rigidLink('beam', int(diaphragm_start1[i-1]), int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][0]))
-        ops.rigidLink('beam', int(diaphragm_end1[i-1]), int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][-1]))
-        for idx in range(len(crossbeam_index[0])):
-            ops.rigidLink('beam',
-                int(ctx['girder'+str(i)][0]['girder'+str(i)+'_centroid'].T[0][crossbeam_index[0][idx]]),
-                int(ctx[f'crossbeam{idx+1}_1'][i-1]))
+        c_i = centroid_tags[i-1]
+        add_link((_int(diaphragm_start1[i-1]), c_i[0]))
+        add_link((_int(diaphragm_end1[i-1]), c_i[-1]))
+        for idx in range(len(crossbeam_index)):
+            add_link((c_i[crossbeam_index[idx]], _int(ctx[xbeam_keys[idx]][i-1])))
 
-    Bridge1 = Analysis(girder_length / 1000, Bridge_width, nums_girder=nums_girder, skew=Bridge_skew, params=p)
     pave_E = [2500]
     pavement = Bridge1.pavement(3, pave_thick, pave_E, bridge_width_spacings, slab_thickness_spacing_cumsum)
 
-    for i in range(len(deck1.keys())):
-        for j in range(imax):
-            ops.rigidLink('beam',
-                int(deck1['slab'+str(i)].T[0][j]),
-                int(pavement['pavement'+str(i)].T[0][j]))
+    for slab_key, pave_key in zip(deck1, pavement):
+        slab_i = deck1[slab_key][:, 0].astype(np.int64).tolist()
+        pave_i = pavement[pave_key][:, 0].astype(np.int64).tolist()
+        links.extend(zip(slab_i[:imax], pave_i[:imax]))
+
+    rlink = ops.rigidLink
+    for a, b in links:
+        rlink('beam', a, b)
 
     print("✅ Bridge model successfully built.")
     return BuiltModel(analysis=Bridge1, params=p, ctx=ctx)
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import warnings
+
 import numpy as np
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 try:
     import vfo.vfo as vfo
 except Exception:  # pragma: no cover
     vfo = None
 
+try:  # optional: VTK 기반 off-screen 렌더러
+    import pyvista as pv  # type: ignore
+except Exception:  # pragma: no cover
+    pv = None
+
 try:
     import openseespy.opensees as ops  # type: ignore
     _OPENSEESPY_IMPORT_ERROR = None
@@ -19,14 +27,66 @@ except Exception as e:  # pragma: no cover
 
 
 def _set_equal_aspect_3d(ax):
-    xlim = np.array(ax.get_xlim3d())
-    ylim = np.array(ax.get_ylim3d())
-    zlim = np.array(ax.get_zlim3d())
-    c = np.array([xlim.mean(), ylim.mean(), zlim.mean()])
-    r = max(xlim.ptp(), ylim.ptp(), zlim.ptp()) / 2
-    ax.set_xlim3d(c[0]-r, c[0]+r)
-    ax.set_ylim3d(c[1]-r, c[1]+r)
-    ax.set_zlim3d(c[2]-r, c[2]+r)
+    xlo, xhi = ax.get_xlim3d()
+    ylo, yhi = ax.get_ylim3d()
+    zlo, zhi = ax.get_zlim3d()
+    cx, cy, cz = (xlo+xhi)*0.5, (ylo+yhi)*0.5, (zlo+zhi)*0.5
+    r = max(xhi-xlo, yhi-ylo, zhi-zlo)*0.5
+    ax.set_xlim3d(cx-r, cx+r)
+    ax.set_ylim3d(cy-r, cy+r)
+    ax.set_zlim3d(cz-r, cz+r)
+
+
+def _model_wireframe():
+    """현재 도메인의 노드 좌표 (N, 3)와 요소 선분의 좌표 행 번호 쌍 (S, 2)을 반환."""
+    # 노드 좌표는 한 번만 조회: (N, 3) 배열 + 태그→행 번호
+    all_nodes = ops.getNodeTags()
+    XYZ = np.fromiter((c for n in all_nodes for c in ops.nodeCoord(n)),
+                      dtype=float, count=3*len(all_nodes)).reshape(-1, 3)
+    row = dict(zip(all_nodes, range(len(all_nodes))))
+
+    ele_nodes = [ops.eleNodes(et) for et in ops.getEleTags()]
+    if not ele_nodes:
+        return XYZ, np.empty((0, 2), dtype=np.intp)
+    counts = np.fromiter(map(len, ele_nodes), dtype=np.intp, count=len(ele_nodes))
+    flat = np.fromiter((row[n] for nodes in ele_nodes for n in nodes),
+                       dtype=np.intp, count=int(counts.sum()))
+    ends = np.cumsum(counts)
+    # 선형/빔: 연속 선 (요소 경계를 넘는 쌍은 제외)
+    inner = np.ones(len(flat) - 1, dtype=bool)
+    inner[ends[:-1] - 1] = False
+    # 쉘(삼각/사각)은 마지막-처음을 닫아줌
+    closed = (counts == 3) | (counts == 4)
+    n_inner = int(inner.sum())
+    pairs = np.empty((n_inner + int(closed.sum()), 2), dtype=np.intp)
+    pairs[:n_inner, 0] = flat[:-1][inner]
+    pairs[:n_inner, 1] = flat[1:][inner]
+    pairs[n_inner:, 0] = flat[ends[closed] - 1]
+    pairs[n_inner:, 1] = flat[(ends - counts)[closed]]
+    return XYZ, pairs
+
+
+def _snapshot_pyvista(path, XYZ, pairs, elev, azim, dpi, lw, node_size):
+    """pyvista(VTK)로 off-screen 렌더링 후 저장. 창 크기는 matplotlib 기본 figsize × dpi."""
+    plotter = pv.Plotter(off_screen=True, window_size=(int(6.4*dpi), int(4.8*dpi)))
+    try:
+        plotter.set_background('white')
+        if len(pairs):
+            lines = np.column_stack([np.full(len(pairs), 2, dtype=np.intp), pairs]).ravel()
+            plotter.add_mesh(pv.PolyData(XYZ, lines=lines), color='#1f77b4', line_width=lw)
+        if len(XYZ):
+            plotter.add_mesh(pv.PolyData(XYZ), color='#1f77b4', point_size=node_size,
+                             render_points_as_spheres=False)
+            # matplotlib view_init(elev, azim)과 같은 방향에서 바라보도록 카메라 배치
+            e, a = np.radians(elev), np.radians(azim)
+            center = 0.5*(XYZ.min(axis=0) + XYZ.max(axis=0))
+            direction = np.array([np.cos(e)*np.cos(a), np.cos(e)*np.sin(a), np.sin(e)])
+            plotter.camera_position = [tuple(center + direction), tuple(center), (0.0, 0.0, 1.0)]
+            plotter.reset_camera()
+        plotter.screenshot(path)
+    finally:
+        plotter.close()
+
 
 def snapshot_model(path=None, use_vfo=True, elev=20, azim=-60, dpi=200, lw=0.8, node_size=6):
 
@@ -44,33 +104,27 @@ def snapshot_model(path=None, use_vfo=True, elev=20, azim=-60, dpi=200, lw=0.8,
         return
 
     # ── Fallback: 간단 와이어프레임 ─────────────────────────────
+    XYZ, pairs = _model_wireframe()
+
+    # pyvista가 있으면 VTK로 한 번에 렌더링; 실패하면(예: OpenGL 없음) 경고 후 matplotlib로
+    if path and pv is not None:
+        try:
+            _snapshot_pyvista(path, XYZ, pairs, elev, azim, dpi, lw, node_size)
+            return
+        except Exception as e:
+            warnings.warn(f"pyvista snapshot failed ({e!r}); falling back to matplotlib",
+                          RuntimeWarning, stacklevel=2)
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
 
-    # 요소 선 그리기
-    for et in ops.getEleTags():
-        nds = ops.eleNodes(et)
-        coords = np.array([ops.nodeCoord(n) for n in nds], dtype=float)
-        # 선형/빔: 연속 선
-        for k in range(len(coords)-1):
-            ax.plot([coords[k,0], coords[k+1,0]],
-                    [coords[k,1], coords[k+1,1]],
-                    [coords[k,2], coords[k+1,2]],
-                    linewidth=lw)
-        # 쉘(삼각/사각)은 마지막-처음을 닫아줌
-        if len(coords) in (3,4):
-            ax.plot([coords[-1,0], coords[0,0]],
-                    [coords[-1,1], coords[0,1]],
-                    [coords[-1,2], coords[0,2]],
-                    linewidth=lw)
-
-    # 노드 산점
-    all_nodes = ops.getNodeTags()
-    if all_nodes:
-        X = [ops.nodeCoord(n)[0] for n in all_nodes]
-        Y = [ops.nodeCoord(n)[1] for n in all_nodes]
-        Z = [ops.nodeCoord(n)[2] for n in all_nodes]
-        ax.scatter(X, Y, Z, s=node_size)
+    # 요소 선 그리기: 모든 선분을 하나의 collection으로
+    if len(pairs):
+        ax.add_collection3d(Line3DCollection(np.take(XYZ, pairs, axis=0), linewidths=lw))
+
+    # 노드 산점 (축 범위도 여기서 결정됨)
+    if len(XYZ):
+        ax.scatter(XYZ[:, 0], XYZ[:, 1], XYZ[:, 2], s=node_size)
 
     ax.view_init(elev=elev, azim=azim)
     _set_equal_aspect_3d(ax)
@@ -79,4 +133,3 @@ def snapshot_model(path=None, use_vfo=True, elev=20, azim=-60, dpi=200, lw=0.8,
     if path:
         plt.savefig(path, dpi=dpi, bbox_inches="tight")
     plt.close(fig)
-
@@ -1,7 +1,7 @@
 """Utility functions for plotting and post-processing."""
 
-from .plotting import plot_time_series
+from .plotting import plot_acceleration_with_min
 
 __all__ = [
-    "plot_time_series",
+    "plot_acceleration_with_min",
 ]
@@ -3,8 +3,56 @@
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
+try:  # optional
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None
+
+try:  # optional: multithreaded CSV parser
+    import pyarrow  # type: ignore  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except Exception:  # pragma: no cover
+    _CSV_ENGINE = "c"
+
+
+def _min_max_scan(y):
+    """Return `(min, argmin, max, argmax)` of a 1-D array in a single pass.
+
+    NaNs are skipped and ties resolve to the first occurrence, as with
+    `np.nanargmin`/`np.nanargmax`; an all-NaN array raises ValueError.
+    """
+    n = y.shape[0]
+    start = 0
+    while start < n and np.isnan(y[start]):
+        start += 1
+    if start == n:
+        raise ValueError("All-NaN slice encountered")
+    lo = y[start]
+    hi = y[start]
+    i_lo = start
+    i_hi = start
+    for i in range(start + 1, n):
+        v = y[i]
+        if v < lo:
+            lo = v
+            i_lo = i
+        elif v > hi:
+            hi = v
+            i_hi = i
+    return lo, i_lo, hi, i_hi
+
+
+if njit is not None:
+    _min_max = njit(cache=True)(_min_max_scan)
+else:  # pragma: no cover
+    def _min_max(y):
+        i_lo, i_hi = int(np.nanargmin(y)), int(np.nanargmax(y))
+        return y[i_lo], i_lo, y[i_hi], i_hi
+
+
 def plot_acceleration_with_min(csv_path, index=None, n_channels=6):
     """
     시간-변위 그래프를 그리고 선택된 센서(index)의 최소값과 최대값(hline) 및 수치를 표시하는 함수
@@ -21,74 +69,67 @@ def plot_acceleration_with_min(csv_path, index=None, n_channels=6):
     # ============================================================
     # 1️⃣ 데이터 불러오기
     # ============================================================
-    df = pd.read_csv(csv_path)
+    # 시간열 + 변위 열(예: 7~12열)만 파싱; 헤더를 먼저 읽어 열 위치를 이름으로 변환
+    # (pyarrow 엔진은 정수 위치 usecols를 받지 않음)
+    names = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [names[c] for c in [0, *range(1+6, n_channels+1+6)] if c < len(names)]
+    df = pd.read_csv(csv_path, usecols=usecols, engine=_CSV_ENGINE)
 
     # ============================================================
     # 2️⃣ 시간열 + 변위 데이터 추출
     # ============================================================
-    time = df.iloc[:, 0].values
-    disp_data = df.iloc[:, 1+6:n_channels+1+6]  # 변위 데이터 (예: 7~12열)
+    time = df.iloc[:, 0].to_numpy(copy=False)
+    disp = df.iloc[:, 1:].to_numpy()  # 변위 데이터 (행: 시간, 열: 센서)
+    cols = list(df.columns[1:])
 
     # ============================================================
     # 3️⃣ 특정 인덱스 선택
     # ============================================================
     if index is not None:
-        if index < 0 or index >= disp_data.shape[1]:
-            raise ValueError(f"index={index} is out of range (0 ~ {disp_data.shape[1]-1})")
-        disp_data = disp_data.iloc[:, [index]]
+        if index < 0 or index >= disp.shape[1]:
+            raise ValueError(f"index={index} is out of range (0 ~ {disp.shape[1]-1})")
+        disp = disp[:, [index]]
+        cols = [cols[index]]
 
     # ============================================================
     # 4️⃣ 그래프 시각화
     # ============================================================
-    plt.figure(figsize=(12, 8))
+    fig, ax = plt.subplots(figsize=(12, 8), constrained_layout=True)
 
-    for col in disp_data.columns:
-        y = disp_data[col].values
-        min_val = y.min()
-        max_val = y.max()
-        min_time = time[y.argmin()]
-        max_time = time[y.argmax()]
+    stats = {}
+    for col, y in zip(cols, disp.T):
+        stats[col] = _min_max(y)
 
         # 변위 그래프
-        plt.plot(time, y, lw=0.9, label=str(col))
-
-        # 최소값 표시
-        plt.axhline(min_val, color='red', linestyle='--', alpha=0.6)
-        plt.text(
-            time[-1]*0.98,
-            min_val,
-            f"{col} min: {min_val:.4f}",
-            color='red',
-            fontsize=12,
-            ha='right', va='bottom'
-        )
-
-        # 최대값 표시
-        plt.axhline(max_val, color='blue', linestyle='--', alpha=0.6)
-        plt.text(
-            time[-1]*0.98,
-            max_val,
-            f"{col} max: {max_val:.4f}",
-            color='blue',
-            fontsize=12,
-            ha='right', va='bottom'
-        )
-
-    plt.xlabel("Time [sec]")
-    plt.ylabel("Displacement")
+        ax.plot(time, y, lw=0.9, label=str(col))
+
+    # 최소값/최대값 수평선: 센서별 axhline 대신 한 번에 그림
+    mins = np.array([v[0] for v in stats.values()])
+    maxs = np.array([v[2] for v in stats.values()])
+    ax.hlines(mins, time[0], time[-1], colors='red', linestyles='--', alpha=0.6)
+    ax.hlines(maxs, time[0], time[-1], colors='blue', linestyles='--', alpha=0.6)
+
+    # 수치 표시
+    x_text = time[-1]*0.98
+    for col, (min_val, _, max_val, _) in stats.items():
+        ax.text(x_text, min_val, f"{col} min: {min_val:.4f}",
+                color='red', fontsize=12, ha='right', va='bottom')
+        ax.text(x_text, max_val, f"{col} max: {max_val:.4f}",
+                color='blue', fontsize=12, ha='right', va='bottom')
+
+    ax.set_xlabel("Time [sec]")
+    ax.set_ylabel("Displacement")
     title_suffix = f" (Sensor {index})" if index is not None else " (All Sensors)"
-    plt.title(f"Time–Displacement History with Min/Max Values{title_suffix}")
-    plt.legend(loc="upper right", ncol=2)
-    plt.grid(alpha=0.3)
-    plt.tight_layout()
+    ax.set_title(f"Time–Displacement History with Min/Max Values{title_suffix}")
+    ax.legend(loc="upper right", ncol=2)
+    ax.grid(alpha=0.3)
     plt.show()
 
     # ============================================================
     # 5️⃣ 최소값 / 최대값 요약 출력
     # ============================================================
     print("📊 최소값 및 최대값 요약")
-    for col in disp_data.columns:
-        y = disp_data[col].values
-        print(f"{col:10s}: min = {y.min():.6f} at t = {time[y.argmin()]:.3f} sec")
-        print(f"{'':10s}  max = {y.max():.6f} at t = {time[y.argmax()]:.3f} sec\n")
+    for col, (min_val, i_min, max_val, i_max) in stats.items():
+        print(f"{col:10s}: min = {min_val:.6f} at t = {time[i_min]:.3f} sec")
+        print(f"{'':10s}  max = {max_val:.6f} at t = {time[i_max]:.3f} sec\n")
 
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from bridge_psci.model.builder import _merge_spacings, _shell_nodal_mass, _sorted_indices
+
+
+def test_sorted_indices_matches_isin():
+    haystack = np.array([0.0, 1.0, 1.25, 2.0, 3.0, 3.25, 4.0])
+    needles = np.array([3.25, 0.0, 2.0])
+
+    idx = _sorted_indices(haystack, needles)
+
+    np.testing.assert_array_equal(idx, np.where(np.isin(haystack, needles))[0])
+    np.testing.assert_array_equal(idx, [0, 3, 5])
+
+
+def test_sorted_indices_collapses_duplicate_needles():
+    haystack = np.array([0.0, 1.0, 2.0, 3.0])
+
+    np.testing.assert_array_equal(_sorted_indices(haystack, [2.0, 1.0, 2.0, 1.0]), [1, 2])
+
+
+@pytest.mark.parametrize("needles", [[1.5], [4.0], [-1.0], [0.0, 2.5]])
+def test_sorted_indices_rejects_missing_needle(needles):
+    haystack = np.array([0.0, 1.0, 2.0, 3.0])
+
+    with pytest.raises(ValueError, match="not found"):
+        _sorted_indices(haystack, needles)
+
+
+def test_merge_spacings_is_rounded_sorted_union():
+    merged = _merge_spacings(np.arange(0.0, 4.0, 1.0), [1.2500001, 3.25, 0.0, 4.5])
+
+    np.testing.assert_array_equal(merged, [0.0, 1.0, 1.25, 2.0, 3.0, 3.25, 4.5])
+
+
+def test_shell_nodal_mass_conserves_total_mass():
+    # 3 strips x 5 stations, non-uniform in both directions
+    x = np.array([0.0, 200.0, 450.0, 650.0, 1000.0])
+    y = np.array([0.0, 1250.0, 2000.0])
+    X, Y = np.meshgrid(x, y)
+    t_rows = np.array([240.0, 300.0])
+    rho = 2.5e-9
+
+    nodal = _shell_nodal_mass(X, Y, t_rows, rho)
+
+    assert nodal.shape == X.shape
+    expected = rho * (x[-1] - x[0]) * np.sum(np.diff(y) * t_rows)
+    assert nodal.sum() == pytest.approx(expected, rel=1e-12)
+    # corner nodes touch one element and receive a quarter of its mass
+    assert nodal[0, 0] == pytest.approx(rho * t_rows[0] * 200.0 * 1250.0 / 4)
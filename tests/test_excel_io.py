@@ -0,0 +1,17 @@
+import pytest
+
+from bridge_psci import legacy_globals
+from bridge_psci.config import make_params
+from bridge_psci.io.excel_io import derive_section_from_dimensions
+
+
+def test_derive_section_updates_dimensions_only():
+    params = make_params("baseline")
+    params.update(UF=800.0, WT=250.0)
+    before = {k: params.get(k) for k in ("A_t", "B_t", "I_n", "yt3")}
+
+    derive_section_from_dimensions(params)
+
+    assert {k: params.get(k) for k in before} == before
+    assert params["b1"] == 800.0 and params["b3"] == 250.0
+    assert params["Ag"] == pytest.approx(legacy_globals.compute_section_properties(params)["Ag"])
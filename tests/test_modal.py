@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+ops = pytest.importorskip("openseespy.opensees")
+
+from bridge_psci.analysis import modal
+from bridge_psci.analysis.moving_load import run_moving_load
+from bridge_psci.model.builder import Analysis, BuiltModel
+
+
+def _build_beam(params):
+    # simply supported 3D beam, 6 elements; small enough for a dense eigen solve
+    ops.wipe()
+    ops.model("basic", "-ndm", 3, "-ndf", 6)
+    x = np.linspace(0.0, 12000.0, 7)
+    for tag, xi in enumerate(x, start=1):
+        ops.node(tag, float(xi), 0.0, 0.0)
+        ops.mass(tag, 0.5, 0.5, 0.5, 0.0, 0.0, 0.0)
+    ops.fix(1, 1, 1, 1, 1, 0, 0)
+    ops.fix(len(x), 0, 1, 1, 0, 0, 0)
+    ops.geomTransf("Linear", 1, 0.0, 0.0, 1.0)
+    for tag in range(1, len(x)):
+        ops.element("elasticBeamColumn", tag, tag, tag + 1, 4.0e5, 28000.0, 11200.0, 2.0e10, 1.5e11, 3.0e11, 1)
+    return BuiltModel(analysis=Analysis(12000.0, 0.0, 1, 0.0), params=params, ctx={})
+
+
+def test_precomputed_domain_gives_same_frequencies(monkeypatch):
+    monkeypatch.setattr(modal, "build_bridge_model", _build_beam)
+    params = {"numEigen": 3, "eigen_solver": "-fullGenLapack", "point_load_n": -10000.0}
+    kwargs = dict(check_nodes=(3, 4, 5), load_nodes=(3, 5), save_json=False)
+
+    freq_ref, eig_ref, defl_ref = modal.run_modal(params, **kwargs)
+    freq, eig, defl = modal.run_modal(params, precomputed=modal.prepare_domain(params), **kwargs)
+
+    np.testing.assert_allclose(freq, freq_ref, rtol=1e-10)
+    np.testing.assert_allclose(eig, eig_ref, rtol=1e-10)
+    np.testing.assert_allclose(defl, defl_ref, rtol=1e-10)
+    assert defl_ref[1] < 0.0
+    # the shared domain is handed back unloaded and at its initial state
+    assert list(ops.getPatterns()) == []
+    assert ops.getTime() == 0.0
+    assert ops.nodeDisp(4, 3) == 0.0
+
+
+def test_run_functions_document_the_precomputed_contract():
+    for fn in (modal.run_modal, run_moving_load):
+        assert "prepare_domain(params)" in (fn.__doc__ or "")
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from bridge_psci.analysis import moving_load as ml
+
+requires_numba = pytest.mark.skipif(ml.njit is None, reason="numba not installed")
+
+
+@requires_numba
+def test_jit_kernel_accepts_strided_girder_coords():
+    # run_moving_load passes x as a column view of the (N, 3) coordinate table
+    coords = np.zeros((11, 3))
+    coords[:, 0] = np.linspace(0.0, 1000.0, 11)
+    x_g = coords[:, 0]
+    assert not x_g.flags.c_contiguous
+    x_front = np.linspace(1100.0, -100.0, 25)
+    dists = np.array([0.0, 30.0])
+    loads = np.array([1.0, 2.0])
+
+    expected = np.zeros((11, 25))
+    ml._accumulate_axle_loads_numpy(expected, x_g, x_front, dists, loads, ml._uniform_inv_spacing(x_g))
+    hist = np.zeros((11, 25))
+    ml._accumulate_axle_loads_jit(hist, x_g, x_front, dists, loads, ml._uniform_inv_spacing(x_g))
+
+    np.testing.assert_allclose(hist, expected, rtol=1e-12, atol=0.0)
+
+
+def _girder_x(kind):
+    if kind == "uniform":
+        return np.linspace(0.0, 30000.0, 151)
+    rng = np.random.default_rng(0)
+    return np.concatenate([[0.0], np.cumsum(rng.uniform(50.0, 400.0, 120))])
+
+
+def _axle_case(x_g):
+    # front axle starts past the far end and finishes past the near end
+    x_front = np.linspace(x_g[-1] + 500.0, x_g[0] - 5000.0, 401)
+    dists = np.array([0.0, 3300.0, 4600.0])
+    loads = np.array([30650.0, 57350.0, 55410.0])
+    return x_front, dists, loads
+
+
+@pytest.mark.parametrize("kind", ["uniform", "nonuniform"])
+def test_numpy_kernel_splits_each_axle_load_between_neighbours(kind):
+    x_g = _girder_x(kind)
+    x_front, dists, loads = _axle_case(x_g)
+    hist = np.zeros((len(x_g), len(x_front)))
+    ml._accumulate_axle_loads_numpy(hist, x_g, x_front, dists, loads, ml._uniform_inv_spacing(x_g))
+
+    x_axle = x_front[:, None] + dists[None, :]
+    on_girder = (x_axle >= x_g[0]) & (x_axle <= x_g[-1])
+    np.testing.assert_allclose(hist.sum(axis=0), (on_girder * loads).sum(axis=1), rtol=1e-12)
+    # a lone axle halfway between two nodes loads both equally
+    one = np.zeros((len(x_g), 1))
+    x_mid = 0.5 * (x_g[10] + x_g[11])
+    ml._accumulate_axle_loads_numpy(one, x_g, np.array([x_mid]), np.array([0.0]), np.array([2.0]))
+    np.testing.assert_allclose(one[[10, 11], 0], [1.0, 1.0])
+    assert one.sum() == pytest.approx(2.0)
+
+
+@requires_numba
+@pytest.mark.parametrize("kind", ["uniform", "nonuniform"])
+def test_jit_kernel_matches_numpy(kind):
+    x_g = _girder_x(kind)
+    x_front, dists, loads = _axle_case(x_g)
+    inv_dx = ml._uniform_inv_spacing(x_g)
+    assert (inv_dx > 0.0) == (kind == "uniform")
+
+    expected = np.zeros((len(x_g), len(x_front)))
+    ml._accumulate_axle_loads_numpy(expected, x_g, x_front, dists, loads, inv_dx)
+    hist = np.zeros_like(expected)
+    ml._accumulate_axle_loads_jit(hist, x_g, x_front, dists, loads, inv_dx)
+    np.testing.assert_allclose(hist, expected, rtol=1e-12, atol=1e-9)
+
+    # the dispatcher picks the JIT kernel and gives the same result
+    via_dispatch = np.zeros_like(expected)
+    ml._accumulate_axle_loads(via_dispatch, x_g, x_front, dists, loads)
+    np.testing.assert_allclose(via_dispatch, expected, rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("kind", ["uniform", "nonuniform"])
+def test_grouped_windows_rebuild_per_node_loads(kind):
+    x_g = _girder_x(kind)
+    x_front, dists, loads = _axle_case(x_g)
+    hist = np.zeros((len(x_g), len(x_front)))
+    ml._accumulate_axle_loads_numpy(hist, x_g, x_front, dists, loads, ml._uniform_inv_spacing(x_g))
+
+    groups = ml._group_proportional_rows(hist)
+    rows = [row for _, _, members in groups for row, _ in members]
+    assert sorted(rows) == np.flatnonzero(hist.any(axis=1)).tolist()
+
+    rebuilt = np.zeros_like(hist)
+    for ref_row, (i0, i1), members in groups:
+        for row, scale in members:
+            rebuilt[row, i0:i1] = scale * hist[ref_row, i0:i1]
+    np.testing.assert_allclose(rebuilt, hist, rtol=1e-9, atol=1e-9 * loads.max())
+
+
+def test_proportional_rows_share_one_group():
+    pulse = np.array([0.0, 0.0, 1.0, 3.0, 2.0, 0.0, 0.0, 0.0])
+    hist = np.vstack([
+        0.5 * pulse,
+        np.zeros_like(pulse),
+        2.0 * pulse,
+        np.roll(pulse, 1),  # same shape, different start -> own group
+        pulse,
+    ])
+    groups = ml._group_proportional_rows(hist)
+    assert len(groups) == 2
+    ref_row, (i0, i1), members = groups[0]
+    assert ref_row == 0 and (i0, i1) == (1, 6)
+    assert [row for row, _ in members] == [0, 2, 4]
+    np.testing.assert_allclose([scale for _, scale in members], [1.0, 4.0, 2.0])
@@ -0,0 +1,79 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from bridge_psci.utils import plotting
+
+
+def _nan_reference(y):
+    i_lo, i_hi = int(np.nanargmin(y)), int(np.nanargmax(y))
+    return y[i_lo], i_lo, y[i_hi], i_hi
+
+
+_CASES = [
+    np.array([1.0, np.nan, -3.0]),
+    np.array([np.nan, np.nan, 2.0, -1.0, 2.0, -1.0]),
+    np.array([0.5, 0.5, 0.5]),
+    np.array([np.nan, 4.0, np.nan]),
+    np.random.default_rng(0).normal(size=500),
+]
+
+
+@pytest.mark.parametrize("y", _CASES)
+@pytest.mark.parametrize("impl", ["scan", "dispatch"])
+def test_min_max_matches_nanargmin_nanargmax(y, impl):
+    fn = plotting._min_max_scan if impl == "scan" else plotting._min_max
+
+    assert fn(y) == _nan_reference(y)
+
+
+@pytest.mark.parametrize("impl", ["scan", "dispatch"])
+def test_min_max_rejects_all_nan(impl):
+    fn = plotting._min_max_scan if impl == "scan" else plotting._min_max
+    y = np.full(3, np.nan)
+
+    with pytest.raises(ValueError):
+        _nan_reference(y)
+    with pytest.raises(ValueError):
+        fn(y)
+
+
+@pytest.fixture
+def accel_csv(tmp_path):
+    # time + 6 columns the plot skips + 6 sensor columns (13 in total)
+    t = np.round(np.arange(0.0, 2.0, 0.1), 1)
+    rng = np.random.default_rng(1)
+    data = {"time": t}
+    data.update({f"skip{i}": rng.normal(size=t.size) for i in range(6)})
+    data.update({f"s{i}": np.sin(t * (i + 1)) for i in range(6)})
+    path = tmp_path / "accel.csv"
+    pd.DataFrame(data).to_csv(path, index=False)
+    return path, t, data
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+@pytest.mark.parametrize("index", [None, 2])
+def test_plot_acceleration_with_min_reads_sensor_columns(accel_csv, engine, index, monkeypatch, capsys):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(plotting, "_CSV_ENGINE", engine)
+    path, t, data = accel_csv
+    sensors = [f"s{i}" for i in range(6)] if index is None else [f"s{index}"]
+
+    try:
+        plotting.plot_acceleration_with_min(path, index=index)
+        ax = plt.gcf().axes[0]
+        assert [line.get_label() for line in ax.get_lines()] == sensors
+    finally:
+        plt.close("all")
+
+    out = capsys.readouterr().out
+    for col in sensors:
+        y = data[col]
+        assert f"{col:10s}: min = {y.min():.6f} at t = {t[y.argmin()]:.3f} sec" in out
+        assert f"max = {y.max():.6f} at t = {t[y.argmax()]:.3f} sec" in out
@@ -0,0 +1,116 @@
+import types
+
+import numpy as np
+import pytest
+
+from bridge_psci.model import visualization
+from bridge_psci.model.visualization import _model_wireframe
+
+
+def test_model_wireframe_beam_and_shell():
+    ops = pytest.importorskip("openseespy.opensees")
+    ops.wipe()
+    ops.model("basic", "-ndm", 3, "-ndf", 6)
+    coords = {10: (0.0, 0.0, -1.0), 20: (0.0, 0.0, 0.0), 30: (2.0, 0.0, 0.0),
+              40: (2.0, 1.0, 0.0), 50: (0.0, 1.0, 0.0)}
+    for tag, xyz in coords.items():
+        ops.node(tag, *xyz)
+    ops.geomTransf("Linear", 1, 1.0, 0.0, 0.0)
+    ops.element("elasticBeamColumn", 1, 10, 20, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1)
+    ops.section("ElasticMembranePlateSection", 1, 1.0, 0.2, 0.1, 0.0)
+    ops.element("ShellMITC4", 2, 20, 30, 40, 50, 1)
+
+    XYZ, pairs = _model_wireframe()
+
+    tags = list(ops.getNodeTags())
+    np.testing.assert_array_equal(XYZ, [coords[t] for t in tags])
+    row = {t: i for i, t in enumerate(tags)}
+    # beam segment, the shell's three open edges, then the edge closing the shell
+    expected = [(10, 20), (20, 30), (30, 40), (40, 50), (50, 20)]
+    assert pairs.dtype == np.intp
+    np.testing.assert_array_equal(pairs, [(row[a], row[b]) for a, b in expected])
+
+
+class _FakePlotter:
+    """Records what _snapshot_pyvista hands to a pyvista Plotter."""
+
+    instances = []
+
+    def __init__(self, off_screen, window_size):
+        self.window_size = window_size
+        self.meshes = []
+        self.camera_position = None
+        self.camera_at_reset = None
+        self.saved = None
+        self.closed = False
+        _FakePlotter.instances.append(self)
+
+    def set_background(self, color):
+        pass
+
+    def add_mesh(self, mesh, **kwargs):
+        self.meshes.append((mesh, kwargs))
+
+    def reset_camera(self):
+        self.camera_at_reset = self.camera_position
+
+    def screenshot(self, path):
+        self.saved = path
+
+    def close(self):
+        self.closed = True
+
+
+class _FakePolyData:
+    def __init__(self, points, lines=None):
+        self.points = np.asarray(points)
+        self.lines = lines
+
+
+def _fake_pv():
+    _FakePlotter.instances = []
+    return types.SimpleNamespace(Plotter=_FakePlotter, PolyData=_FakePolyData)
+
+
+_XYZ = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 1.0, 0.0], [0.0, 1.0, 2.0]])
+_PAIRS = np.array([[0, 1], [1, 2], [2, 3], [3, 0]], dtype=np.intp)
+
+
+def test_snapshot_pyvista_line_layout_and_camera(monkeypatch):
+    monkeypatch.setattr(visualization, "pv", _fake_pv())
+
+    visualization._snapshot_pyvista("out.png", _XYZ, _PAIRS, 20, -60, 100, 0.8, 6)
+
+    (plotter,) = _FakePlotter.instances
+    assert plotter.window_size == (640, 480)
+    assert plotter.saved == "out.png" and plotter.closed
+    (lines_mesh, line_kw), (points_mesh, _) = plotter.meshes
+    # VTK cell array: [2, i, j] per segment
+    np.testing.assert_array_equal(lines_mesh.lines, [2, 0, 1, 2, 1, 2, 2, 2, 3, 2, 3, 0])
+    np.testing.assert_array_equal(lines_mesh.points, _XYZ)
+    assert line_kw["line_width"] == 0.8
+    np.testing.assert_array_equal(points_mesh.points, _XYZ)
+    assert points_mesh.lines is None
+
+    eye, focal, up = plotter.camera_at_reset
+    center = np.array([1.0, 0.5, 1.0])
+    e, a = np.radians(20), np.radians(-60)
+    expected = [np.cos(e) * np.cos(a), np.cos(e) * np.sin(a), np.sin(e)]
+    np.testing.assert_allclose(focal, center)
+    np.testing.assert_allclose(np.subtract(eye, focal), expected)
+    assert up == (0.0, 0.0, 1.0)
+
+
+def test_snapshot_model_warns_when_pyvista_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(visualization, "pv", _fake_pv())
+    monkeypatch.setattr(visualization, "_model_wireframe", lambda: (_XYZ, _PAIRS))
+
+    def broken(*args):
+        raise RuntimeError("no OpenGL context")
+
+    monkeypatch.setattr(visualization, "_snapshot_pyvista", broken)
+    path = tmp_path / "model.png"
+
+    with pytest.warns(RuntimeWarning, match="no OpenGL context"):
+        visualization.snapshot_model(str(path), use_vfo=False, dpi=50)
+    assert path.stat().st_size > 0